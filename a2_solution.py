@@ -1,7 +1,22 @@
 from a2_support import *
+import copy
+import os
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox, filedialog
-from typing import Optional, Callable
+from tkinter import messagebox, filedialog, simpledialog
+import tkinter.font as tkfont
+from collections import OrderedDict
+from typing import Optional, Callable, Iterable, TextIO, Union
+
+from autosave import Autosaver, read_autosave
+from level_pack import LevelPack, PACK_EXTENSION
+from level_parser import LevelParser
+from save_format import (
+    MAGIC, GROUND_KIND, MOUNTAIN_KIND, BUILDING_KIND, 
+    is_binary_save, decode_save, encode_save, read_save
+)
 
 # MODEL ---------------------------------------------------------------------#
 
@@ -109,31 +124,104 @@ class Board():
     """
     Class representing the board of all tiles in the current game state
     """
-    def __init__(self, board: list[list[str]]) -> None:
+    def __init__(self, board: Iterable[Iterable[str]]) -> None:
         """
         Construct all instances on the board with given symbols
 
         Args:
-            (list[list[str]]) board: a sequence of each row of tile symbols.
-                                     Preconditions: all rows are of the same 
-                                     length, and len(board) > 0.
-        """
-        self._height = len(board)
-        self._width = len(board[0])
-
-        # Construct board of instances based on symbols
+            (Iterable[Iterable[str]]) board: a sequence of each row of tile 
+                                             symbols, which may be produced 
+                                             one row at a time. 
+                                             Preconditions: all rows are of 
+                                             the same length, and there is 
+                                             at least one row.
+        """
+        # Construct board of instances based on symbols. Ground and mountain
+        # tiles have no state, so all cells of each kind share one instance.
+        ground = Ground()
+        mountain = Mountain()
         self._board = []
+        self._buildings = {}
         for row in board:
             new_row = []
             for symbol in row:
                 if symbol == GROUND_SYMBOL:
-                    new_row.append(Ground())
+                    new_row.append(ground)
                 elif symbol == MOUNTAIN_SYMBOL:
-                    new_row.append(Mountain())
+                    new_row.append(mountain)
                 else:
-                    new_row.append(Building(int(symbol)))
+                    building = Building(int(symbol))
+                    self._buildings[(len(self._board), len(new_row))] = \
+                        building
+                    new_row.append(building)
             self._board.append(new_row)
 
+        self._height = len(self._board)
+        self._width = len(self._board[0])
+        self._tile_kinds = None  # packed by get_tile_kinds when first needed
+
+    @classmethod
+    def from_tile_kinds(
+        cls, 
+        dimensions: tuple[int, int], 
+        tile_kinds: bytes, 
+        building_health: bytes,
+    ) -> 'Board':
+        """
+        Constructs a board from packed tile kinds, as stored in binary saves,
+        building whole rows at a time instead of parsing tile symbols
+
+        Args:
+            dimensions (tuple[int, int]): (#rows, #columns) of the board
+            tile_kinds (bytes): GROUND_KIND, MOUNTAIN_KIND or BUILDING_KIND 
+                                for each cell, in row-major order
+            building_health (bytes): Health of each building, in row-major 
+                                     order
+
+        Returns:
+            Board: The board described by the tile kinds
+        """
+        board = cls.__new__(cls)
+        board._height, board._width = dimensions
+        board._tile_kinds = bytes(tile_kinds)
+        tiles = [None, None, None]  # indexed by tile kind
+        tiles[GROUND_KIND] = Ground()
+        tiles[MOUNTAIN_KIND] = Mountain()
+        board._board = [
+            [tiles[kind] for kind in tile_kinds[start:start + board._width]]
+            for start in range(0, len(tile_kinds), board._width)
+        ]
+
+        # Building cells were left as None above, to be filled in here
+        board._buildings = {}
+        index = -1
+        for health in building_health:
+            index = tile_kinds.index(BUILDING_KIND, index + 1)
+            row, col = divmod(index, board._width)
+            board._board[row][col] = Building(health)
+            board._buildings[(row, col)] = board._board[row][col]
+        return board
+
+    def get_tile_kinds(self) -> bytes:
+        """
+        (bytes) Returns the GROUND_KIND, MOUNTAIN_KIND or BUILDING_KIND of 
+        each cell, in row-major order
+        """
+        # Tiles never change kind, so the result is kept, and shared by copies
+        if self._tile_kinds is None:
+            self._tile_kinds = b"".join(
+                bytes([TILE_KINDS[tile.get_tile_name()] for tile in row]) 
+                for row in self._board
+            )
+        return self._tile_kinds
+
+    def get_building_health(self) -> bytes:
+        """
+        (bytes) Returns the health of each building, in row-major order
+        """
+        return bytes(int(str(building)) 
+                     for building in self._buildings.values())
+
     def __repr__(self) -> str:
         return (
             "Board(" + 
@@ -150,6 +238,20 @@ class Board():
             ]
         )
 
+    def write_to(self, file: TextIO) -> None:
+        """
+        Writes the same text as str(self) to a file one row at a time, so 
+        only a single row is held in memory
+
+        Args:
+            file (TextIO): An open text file
+        """
+        separator = ""
+        for row in self._board:
+            file.write(separator)
+            file.write("".join(map(str, row)))
+            separator = "\n"
+
     def get_dimensions(self) -> tuple[int, int]:
         """
         (tuple[int, int]) Return the dimensions of the board (#rows, #columns)
@@ -169,13 +271,35 @@ class Board():
         (dict[tuple[int, int], Building]) Return a dictionary of building
         instances, where the key is the position and the value is the instance
         """
-        buildings = {}
-        for row in range(self._height):
-            for col in range(self._width):
-                tile = self.get_tile((row, col))
-                if tile.get_tile_name() == BUILDING_NAME:
-                    buildings[(row, col)] = tile
-        return buildings
+        # Buildings are damaged in place and never added or removed, so the
+        # mapping built on construction stays valid
+        return dict(self._buildings)
+
+    def copy(self) -> 'Board':
+        """
+        (Board) Returns an independent copy of the board. Ground and mountain
+        tiles never change, so they are shared with the copy and only 
+        buildings are duplicated.
+        """
+        board = copy.copy(self)
+        board._board = [list(row) for row in self._board]
+        board._buildings = {}
+        for (row, col), building in self._buildings.items():
+            building = copy.copy(building)
+            board._board[row][col] = building
+            board._buildings[(row, col)] = building
+        return board
+
+    def update_from(self, board: 'Board') -> None:
+        """
+        Gives each building the state of its counterpart in a copy of this 
+        board, keeping this board's building objects
+
+        Args:
+            board (Board): A copy of this board, made by copy
+        """
+        for position, building in self._buildings.items():
+            vars(building).update(vars(board._buildings[position]))
 
 
 class Entity:
@@ -438,6 +562,18 @@ class Enemy(Entity):
         """
         return self._objective
 
+    def set_objective(self, objective: tuple[int, int]) -> None:
+        """
+        Sets the enemy's objective position, such as when restoring a saved 
+        game state. Objectives are otherwise decided by update_objective.
+
+        update_objective can keep the previous objective, for example once 
+        nothing is left to target after a loss. Saves do not hold it, so 
+        formats that restore game states mid-game store it, so that turns 
+        played after a loss and save/load round trips match exactly.
+        """
+        self._objective = objective
+
     def update_objective(self, entities: list[Entity], 
                          buildings: dict[tuple[int, int], Building]) -> None:
         """
@@ -521,6 +657,54 @@ ENTITY_MAP = {
     for entity_class in [TankMech, HealMech, Scorpion, Firefly]
 }
 
+ZOBRIST_MASK = (1 << 64) - 1
+
+# Saves with this extension use the binary format of save_format
+BINARY_SAVE_EXTENSION = ".itb"
+
+# Number of parsed levels kept by the level cache
+LEVEL_CACHE_SIZE = 16
+
+# Feature planes written by BreachModel.encode, one value per board cell
+TILE_PLANE = 0
+BUILDING_HEALTH_PLANE = 1
+MECH_PLANE = 2
+ENEMY_PLANE = 3
+HEALTH_PLANE = 4
+SPEED_PLANE = 5
+STRENGTH_PLANE = 6
+OBSERVATION_PLANES = 7
+
+# Values of the tile plane
+TILE_KINDS = {
+    GROUND_NAME: GROUND_KIND, 
+    MOUNTAIN_NAME: MOUNTAIN_KIND, 
+    BUILDING_NAME: BUILDING_KIND,
+}
+
+
+def zobrist_key(*features) -> int:
+    """
+    Returns a deterministic 64-bit key for the given sequence of features,
+    by chaining each feature through a splitmix64 mixer. Keys are identical
+    across processes, so hashes built from them can be shared between
+    workers and stored alongside saved states.
+
+    Args:
+        features (int | str): Integers or single character strings
+                              describing one component of the game state
+    """
+    key = 0
+    for feature in features:
+        if isinstance(feature, str):
+            feature = ord(feature)
+        key = (key ^ feature ^ 0x9E3779B97F4A7C15) & ZOBRIST_MASK
+        key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & ZOBRIST_MASK
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & ZOBRIST_MASK
+        key ^= key >> 31
+    return key
+
+
 class BreachModel():
     """
     Class that models the logical state of a game of Into The Breach
@@ -540,6 +724,20 @@ class BreachModel():
 
         self._can_save = True
 
+        # The hash is computed on first use, so that loading a large level 
+        # does not pay for it. Until then, changes to it are collected in 
+        # _hash and discarded once the base hash has been computed.
+        self._hash_base = None
+        self._hash = 0
+        self._positions_buffer = {}
+
+        # Buffer last written by encode, and cells changed since then
+        self._encoded = None
+        self._dirty = set()
+
+        # Paths of the enemies that moved during the last turn
+        self._movements = []
+
     def __str__(self) -> str:
         model_representation = str(self._board) + "\n"
 
@@ -549,12 +747,227 @@ class BreachModel():
 
         return model_representation
 
+    def write_to(self, file: TextIO) -> None:
+        """
+        Writes the same text as str(self) to a file, streaming board rows 
+        and entity lines instead of building the whole text first
+
+        Args:
+            file (TextIO): An open text file
+        """
+        self._board.write_to(file)
+        file.write("\n")
+        for entity in self._entities:
+            file.write("\n")
+            file.write(str(entity))
+
     def get_board(self) -> Board:
         """
         (Board) Returns current board state
         """
         return self._board
 
+    def copy(self) -> 'BreachModel':
+        """
+        (BreachModel) Returns an independent copy of the game state, which 
+        can be advanced without affecting this model. Entities keep their 
+        order, so an entity's index identifies it in both models.
+        """
+        model = copy.copy(self)
+        model._board = self._board.copy()
+        model._entities = [copy.copy(entity) for entity in self._entities]
+        model._positions_buffer = {}
+        model._encoded = None
+        model._dirty = set()
+        model._movements = []
+        return model
+
+    def update_from(self, model: 'BreachModel', 
+                    copied_entities: list[Entity]) -> None:
+        """
+        Gives this model the game state of a copy of it that has since been 
+        advanced, for example on another thread. This model keeps its own 
+        entity and building objects, so references to them stay valid.
+
+        Args:
+            model (BreachModel): A copy of this model, made by copy
+            copied_entities (list[Entity]): The copy's entities as they were 
+                                            when it was made, which match 
+                                            this model's entities by index
+        """
+        originals = {
+            id(copied): original 
+            for copied, original in zip(copied_entities, self._entities)
+        }
+        self._board.update_from(model._board)
+        self._entities = [originals[id(entity)] for entity in model._entities]
+        for entity in model._entities:
+            vars(originals[id(entity)]).update(vars(entity))
+        self._movements = [(originals[id(entity)], path) 
+                           for entity, path in model._movements]
+
+        self._can_save = model._can_save
+        self._hash_base = model._hash_base
+        self._hash = model._hash
+        self._dirty |= model._dirty
+
+    def state_hash(self) -> int:
+        """
+        (int) Returns the 64-bit Zobrist hash of the current game state. The 
+        hash is updated incrementally as the model changes, so it can be 
+        used as an O(1) key for transposition tables and cycle detection.
+        Only changes made through this model's methods are tracked.
+        """
+        if self._hash_base is None:
+            self._hash_base = self._compute_hash()
+            self._hash = 0
+        return self._hash_base ^ self._hash
+
+    def _tile_key(self, position: tuple[int, int], tile: Tile) -> int:
+        """
+        (int) Returns the Zobrist key of a non-ground tile at a position
+        """
+        return zobrist_key(TILE_SYMBOL, str(tile), *position)
+
+    def _entity_key(self, entity: Entity) -> int:
+        """
+        (int) Returns the Zobrist key describing an entity's current state
+        """
+        return zobrist_key(
+            ENTITY_SYMBOL,
+            entity.get_symbol(),
+            *entity.get_position(),
+            entity.get_health(),
+            entity.get_speed(),
+            entity.get_strength(),
+            entity.is_friendly() and entity.is_active()
+        )
+
+    def _compute_hash(self) -> int:
+        """
+        (int) Returns the Zobrist hash of the current game state, computed 
+        from scratch
+        """
+        height, width = self._board.get_dimensions()
+        state_hash = zobrist_key(height, width)
+        for row in range(height):
+            for col in range(width):
+                tile = self._board.get_tile((row, col))
+                if tile.get_tile_name() != GROUND_NAME:
+                    state_hash ^= self._tile_key((row, col), tile)
+
+        for entity in self._entities:
+            state_hash ^= self._entity_key(entity)
+        return state_hash
+
+    def _move_entity(self, entity: Entity, position: tuple[int, int]) -> None:
+        """
+        Moves an entity to a position, keeping the state hash up to date
+
+        Args:
+            entity (Entity): Entity to move
+            position (tuple[int, int]): Position to move entity to
+        """
+        self._hash ^= self._entity_key(entity)
+        self._dirty.add(entity.get_position())
+        entity.set_position(position)
+        self._dirty.add(position)
+        self._hash ^= self._entity_key(entity)
+
+    def _set_active(self, entity: Entity, active: bool) -> None:
+        """
+        Enables or disables a mech, keeping the state hash up to date
+
+        Args:
+            entity (Entity): Mech to enable or disable
+            active (bool): True to enable the mech, False to disable it
+        """
+        self._hash ^= self._entity_key(entity)
+        if active:
+            entity.enable()
+        else:
+            entity.disable()
+        self._hash ^= self._entity_key(entity)
+
+    def _damage_building(self, position: tuple[int, int], 
+                         building: Building, damage: int) -> None:
+        """
+        Damages a building, keeping the state hash up to date
+
+        Args:
+            position (tuple[int, int]): Position of the building
+            building (Building): Building to damage
+            damage (int): Amount of damage to deal
+        """
+        self._hash ^= self._tile_key(position, building)
+        building.damage(damage)
+        self._dirty.add(position)
+        self._hash ^= self._tile_key(position, building)
+
+    def _attack_entity(self, attacker: Entity, target: Entity) -> None:
+        """
+        Makes one entity attack another, keeping the state hash up to date
+
+        Args:
+            attacker (Entity): Entity performing the attack
+            target (Entity): Entity being attacked
+        """
+        self._hash ^= self._entity_key(target)
+        attacker.attack(target)
+        self._dirty.add(target.get_position())
+        self._hash ^= self._entity_key(target)
+
+    def encode(self, buffer) -> None:
+        """
+        Writes the current game state into a buffer of feature planes. The
+        first call for a buffer writes every cell. Later calls with the same
+        buffer only rewrite the cells changed since the previous call, so 
+        the buffer must not be modified elsewhere in between.
+
+        Args:
+            buffer (np.ndarray): Integer array of shape (OBSERVATION_PLANES, 
+                                 #rows, #columns), indexed by the *_PLANE 
+                                 constants
+        """
+        # Neither path builds containers: the tile plane is copied from the 
+        # board's cached tile kinds, and changed cells are matched against 
+        # the entity list directly
+        if buffer is not self._encoded:
+            buffer.fill(0)
+            buffer[TILE_PLANE] = memoryview(
+                self._board.get_tile_kinds()
+            ).cast("B", self._board.get_dimensions())
+            for (row, col), building in self._board.get_buildings().items():
+                buffer[BUILDING_HEALTH_PLANE, row, col] = int(str(building))
+            for entity in self._entities:
+                self._encode_entity(buffer, entity)
+            self._encoded = buffer
+        elif self._dirty:
+            for row, col in self._dirty:
+                tile = self._board.get_tile((row, col))
+                if tile.get_tile_name() == BUILDING_NAME:
+                    buffer[BUILDING_HEALTH_PLANE, row, col] = int(str(tile))
+                buffer[MECH_PLANE:, row, col] = 0
+            for entity in self._entities:
+                if entity.get_position() in self._dirty:
+                    self._encode_entity(buffer, entity)
+        self._dirty.clear()
+
+    def _encode_entity(self, buffer, entity: Entity) -> None:
+        """
+        Writes the entity planes of an entity's cell of an encoded buffer
+
+        Args:
+            buffer (np.ndarray): Buffer being encoded into
+            entity (Entity): Entity to write
+        """
+        row, col = entity.get_position()
+        buffer[MECH_PLANE, row, col] = entity.is_friendly()
+        buffer[ENEMY_PLANE, row, col] = not entity.is_friendly()
+        buffer[HEALTH_PLANE, row, col] = entity.get_health()
+        buffer[SPEED_PLANE, row, col] = entity.get_speed()
+        buffer[STRENGTH_PLANE, row, col] = entity.get_strength()
+
     def get_entities(self) -> list[Entity]:
         """
         (list[Entity]) Returns list of current entities in descending priority 
@@ -615,30 +1028,13 @@ class BreachModel():
         """
         return {e.get_position(): e for e in self._entities}
 
-    def _can_move_entity(self, 
-                         entity: Entity, position: tuple[int, int]) -> bool:
+    def get_movements(self) -> list[tuple[Entity, list[tuple[int, int]]]]:
         """
-        Returns whether an entity can be moved to a given position.
-
-        Args:
-            entity (Entity): An entity in the game
-            position (tuple[int, int]): A position on the game board
-
-        Returns:
-            bool: True if the given entity can move to the specified position,
-                  False otherwise.
+        (list[tuple[Entity, list[tuple[int, int]]]]) Returns each enemy that 
+        moved during the last turn, with the path it took from its old 
+        position to its new one, in the order they moved
         """
-        if self._board.get_tile(position).is_blocking():
-            return False
-
-        if position in self.entity_positions():
-            return False
-
-        return (
-            0
-            <= get_distance(self, entity.get_position(), position)
-            <= entity.get_speed()
-        )
+        return list(self._movements)
 
     def get_valid_movement_positions(self, 
                                      entity: Entity) -> list[tuple[int, int]]:
@@ -657,17 +1053,72 @@ class BreachModel():
                                    columns further left appear before positions 
                                    in columns further right.
         """
-        coords = []
-        height, width = self._board.get_dimensions()
-        for row in range(height):
-            for col in range(width):
-                candidate = (row, col)
-                if self._can_move_entity(entity, candidate):
-                    coords.append(candidate)
+        # One search from the entity gives the same distances as calling
+        # get_distance for every cell on the board
+        entity_tiles = self.entity_positions()
+        distances = self._distances_from(
+            entity.get_position(), entity.get_speed(), entity_tiles
+        )
+        return sorted(
+            position for position in distances
+            if position not in entity_tiles 
+            and not self._board.get_tile(position).is_blocking()
+        )
+
+    def _distances_from(
+        self, 
+        origin: tuple[int, int], 
+        limit: Optional[int] = None,
+        entity_tiles: Optional[dict[tuple[int, int], Entity]] = None,
+    ) -> dict[tuple[int, int], int]:
+        """
+        Returns the shortest path distance from an origin to every position 
+        reachable from it, following the same rules as get_distance: paths 
+        avoid blocking tiles and entities, but may begin on either.
+
+        Args:
+            origin (tuple[int, int]): Position to search from
+            limit (Optional[int]): Maximum distance to search. Optional: 
+                                   Defaults to None (no limit).
+            entity_tiles (Optional[dict[tuple[int, int], Entity]]): Current 
+                                    entity positions. Optional: Defaults to 
+                                    None, in which case they are looked up.
 
-        return coords
+        Returns:
+            dict[tuple[int, int], int]: Distance to each reachable position, 
+                                        including the origin at distance 0
+        """
+        if entity_tiles is None:
+            entity_tiles = self.entity_positions()
+        height, width = self._board.get_dimensions()
 
-    def attempt_move(self, entity: Entity, position: tuple[int, int]) -> None:
+        distances = {origin: 0}
+        frontier = [origin]
+        distance = 0
+        while frontier and (limit is None or distance < limit):
+            distance += 1
+            next_frontier = []
+            for row, col in frontier:
+                for d_row, d_col in PLUS_OFFSETS:
+                    node = (row + d_row, col + d_col)
+                    if (
+                        node not in distances
+                        and 0 <= node[0] < height
+                        and 0 <= node[1] < width
+                        and node not in entity_tiles
+                        and not self._board.get_tile(node).is_blocking()
+                    ):
+                        distances[node] = distance
+                        next_frontier.append(node)
+            frontier = next_frontier
+        return distances
+
+    def attempt_move(
+        self, 
+        entity: Entity, 
+        position: tuple[int, int], 
+        valid_positions: Optional[list[tuple[int, int]]] = None,
+    ) -> None:
         """
         Moves a given entity to the specified position if it is active and 
         allowed to move there.
@@ -675,14 +1126,21 @@ class BreachModel():
         Args:
             entity (Entity): An entity to move
             position (tuple[int, int]): Position to move entity to
-        """
+            valid_positions (Optional[list[tuple[int, int]]]): The entity's 
+                valid movement positions in the current state, if already 
+                known. Optional: Defaults to None, in which case they are 
+                found.
+        """
+        if valid_positions is None and entity.is_friendly() \
+                and entity.is_active():
+            valid_positions = self.get_valid_movement_positions(entity)
         if (
             entity.is_friendly()
             and entity.is_active()
-            and position in self.get_valid_movement_positions(entity)
+            and position in valid_positions
         ):
-            entity.set_position(position)
-            entity.disable()
+            self._move_entity(entity, position)
+            self._set_active(entity, False)
 
             # Record movement
             self._can_save = False
@@ -699,10 +1157,10 @@ class BreachModel():
         Updates the objectives of each enemy in the game, based on the current 
         state of the game.
         """
+        buildings = self._board.get_buildings()
         for entity in self._entities:
             if not entity.is_friendly():
-                entity.update_objective(self._entities, 
-                                        self._board.get_buildings())
+                entity.update_objective(self._entities, buildings)
 
     def move_enemies(self) -> None:
         """
@@ -717,10 +1175,19 @@ class BreachModel():
             # Determine position to move to
             target_pos = entity.get_position() # NOTE: If no paths, dont move
             min_dist = float("inf")
-            for candidate in self.get_valid_movement_positions(entity):
-                candidate_distance = get_distance(
-                    self, entity.get_objective(), candidate
-                )
+            objective_distances = self._distances_from(entity.get_objective())
+
+            # Same positions as get_valid_movement_positions, keeping the 
+            # distances so that the path taken can be recorded
+            entity_tiles = self.entity_positions()
+            distances = self._distances_from(
+                entity.get_position(), entity.get_speed(), entity_tiles
+            )
+            for candidate in sorted(
+                position for position in distances
+                if position not in entity_tiles
+            ):
+                candidate_distance = objective_distances.get(candidate, -1)
                 if (
                     (0 <= candidate_distance <= min_dist) or 
                     (candidate_distance == min_dist and candidate >= target_pos)
@@ -728,7 +1195,38 @@ class BreachModel():
                     target_pos = candidate
                     min_dist = candidate_distance
 
-            entity.set_position(target_pos)
+            if target_pos != entity.get_position():
+                self._movements.append(
+                    (entity, self._path_to(target_pos, distances))
+                )
+            self._move_entity(entity, target_pos)
+
+    def _path_to(
+        self, 
+        target: tuple[int, int], 
+        distances: dict[tuple[int, int], int],
+    ) -> list[tuple[int, int]]:
+        """
+        Returns a shortest path to a position, found by stepping back through
+        the distances of a search made with _distances_from
+
+        Args:
+            target (tuple[int, int]): Position at the end of the path
+            distances (dict[tuple[int, int], int]): Distances from the origin
+
+        Returns:
+            list[tuple[int, int]]: Positions from the origin to the target
+        """
+        path = [target]
+        row, col = target
+        for distance in range(distances[target] - 1, -1, -1):
+            for d_row, d_col in PLUS_OFFSETS:
+                if distances.get((row + d_row, col + d_col)) == distance:
+                    row, col = row + d_row, col + d_col
+                    break
+            path.append((row, col))
+        path.reverse()
+        return path
 
     def make_attack(self, entity: Entity) -> None:
         """
@@ -737,6 +1235,19 @@ class BreachModel():
         Args:
             entity (Entity): Entity to perform the attacks
         """
+        self._make_attack(entity, self.entity_positions())
+
+    def _make_attack(self, entity: Entity, 
+                     positions: dict[tuple[int, int], Entity]) -> None:
+        """
+        Makes an entity attack every tile it is targetting, using a 
+        precomputed mapping of entity positions. Positions do not change 
+        during the attack phase, so one mapping serves every attacker.
+
+        Args:
+            entity (Entity): Entity to perform the attacks
+            positions (dict[tuple[int, int], Entity]): Current entity positions
+        """
         for target in entity.get_targets():
             max_height, max_width = self._board.get_dimensions()
             # Check Bounds:
@@ -744,138 +1255,577 @@ class BreachModel():
                 # Damage buildings according to strength of entity
                 target_tile = self._board.get_tile(target)
                 if target_tile.get_tile_name() == BUILDING_NAME:
-                    target_tile.damage(entity.get_strength())
+                    self._damage_building(target, target_tile, 
+                                          entity.get_strength())
 
                 # Attack any entities according to class behavior
-                if target in self.entity_positions():
-                    entity.attack(self.entity_positions()[target])
+                if target in positions:
+                    self._attack_entity(entity, positions[target])
 
     def end_turn(self) -> None:
         """
         Causes all entities to attack in priorty order, then reassigns enemy 
         objectives and moves enemies in priority order
         """
-        # Make attacks in order
+        # Make attacks in order, reusing one position buffer across turns
+        positions = self._positions_buffer
+        positions.clear()
+        for entity in self._entities:
+            positions[entity.get_position()] = entity
         for entity in self._entities:
             if entity.is_alive():  # Note death interrupts attack
-                self.make_attack(entity)
-
-        # Clear dead entities (preserve order)
-        old_entities = self._entities
-        self._entities = []
-        for entity in old_entities:
-            if entity.is_alive():
-                self._entities.append(entity)
+                self._make_attack(entity, positions)
+
+        # Clear dead entities (preserve order), only rebuilding if needed
+        if not all(entity.is_alive() for entity in self._entities):
+            old_entities = self._entities
+            self._entities = []
+            for entity in old_entities:
+                if entity.is_alive():
+                    self._entities.append(entity)
+                else:
+                    self._hash ^= self._entity_key(entity)
+                    self._dirty.add(entity.get_position())
 
         # Move enemies
+        self._movements = []
         self.assign_objectives()
         self.move_enemies()
 
         # Set up for player turn
         for entity in self._entities:
             if entity.is_friendly():
-                entity.enable()
+                self._set_active(entity, True)
         self._can_save = True
 
+    def run_turns(
+        self, 
+        n: int, 
+        mech_policy: Callable[
+            ["BreachModel"], Iterable[tuple[Entity, tuple[int, int]]]
+        ],
+    ) -> list[tuple[int, int, int]]:
+        """
+        Plays up to n turns without any view work. Each turn, the moves chosen
+        by the policy are attempted and then the turn is ended. Stops as soon 
+        as the game has been won or lost.
 
-# VIEW ----------------------------------------------------------------------#
+        Args:
+            n (int): Maximum number of turns to play
+            mech_policy (Callable[[BreachModel], 
+                Iterable[tuple[Entity, tuple[int, int]]]]): Called at the start
+                        of each turn with this model, returning the 
+                        (mech, position) moves to attempt in order
 
-# Maps model symbols to their view counterparts
-SYMBOL_MAP = {
-    TANK_SYMBOL: TANK_DISPLAY,
-    HEAL_SYMBOL: HEAL_DISPLAY,
-    SCORPION_SYMBOL: SCORPION_DISPLAY,
-    FIREFLY_SYMBOL: FIREFLY_DISPLAY,
-}
-SIDEBAR_COLS = 4
+        Returns:
+            list[tuple[int, int, int]]: One (#friendly entities, #enemies, 
+                                        total building health) summary for 
+                                        each turn played
+        """
+        summary = []
+        buildings = self._board.get_buildings().values()
+        for _ in range(n):
+            if self.has_won() or self.has_lost():
+                break
+
+            for mech, position in mech_policy(self):
+                self.attempt_move(mech, position)
+            self.end_turn()
+
+            friendly = 0
+            for entity in self._entities:
+                friendly += entity.is_friendly()
+            summary.append((
+                friendly,
+                len(self._entities) - friendly,
+                sum(int(str(building)) for building in buildings),
+            ))
+        return summary
+
+
+def load_text_level(file_path: str) -> BreachModel:
+    """
+    Loads a game state from a file in the text format.
+
+    Args:
+        file_path (str): file from which to load the game state.
 
+    Returns:
+        BreachModel: The game state described by the file
 
-class BreachView:
+    Raises:
+        IOError: If the file cannot be read or is not text
+        LevelParseError: If the file is not a valid level. This is an 
+                         IOError giving the line and column of the problem.
     """
-    Manages the view of a game of Into The Breach
+    try:
+        with open(file_path) as f:
+            return level_from_lines(f)
+    except UnicodeDecodeError as e:
+        raise IOError(f"{file_path} is not a text level: {e}") from None
+
+
+def level_from_lines(lines: Iterable[str]) -> BreachModel:
     """
-    def __init__(
-        self,
-        root: tk.Tk,
-        board_dims: tuple[
-            int, int
-        ],
-        save_callback: Optional[Callable[[], None]],
-        load_callback: Optional[Callable[[], None]],
-        turn_callback: Optional[Callable[[], None]],
-    ) -> None:
-        """
-        Creates a view of a game of Into The Breach.
+    Builds a game state from the lines of a level in the text format.
 
-        Args:
-            root (tk.Tk): root window
-            board_dims (tuple[ int, int ]): initial board dimensions to display
-            save_callback (Optional[Callable[[], None]]): Callback that should 
-                                                          be called when the 
-                                                          user clicks the 
-                                                          "Save Game" button
-            load_callback (Optional[Callable[[], None]]): Callback that should 
-                                                          be called when the 
-                                                          user clicks the 
-                                                          "Load Game" button
-            turn_callback (Optional[Callable[[], None]]): Callback that should 
-                                                          be called when the 
-                                                          user clicks the 
-                                                          "End Turn" button
-        """
-        root.title(BANNER_TEXT)
+    Args:
+        lines (Iterable[str]): Lines of the level, such as an open file
 
-        self._banner = tk.Label(
-            root, text=BANNER_TEXT, font=BANNER_FONT
-        )  # width and height arguments are different for Label, dont specify.
-        self._game_frame = tk.Frame(root)
-        self._grid = GameGrid(
-            self._game_frame, board_dims, (GRID_SIZE, GRID_SIZE)
-        )
-        self._sidebar = SideBar(
-            self._game_frame, (1, SIDEBAR_COLS), (SIDEBAR_WIDTH, GRID_SIZE)
-        )
-        self._control_bar = ControlBar(
-            root,
-            save_callback,
-            load_callback,
-            turn_callback,
-            width=GRID_SIZE + SIDEBAR_WIDTH,
-            height=CONTROL_BAR_HEIGHT,
+    Returns:
+        BreachModel: The game state described by the lines
+
+    Raises:
+        LevelParseError: If the lines are not a valid level
+    """
+    # The board is built row by row as the lines are read
+    parser = LevelParser(lines)
+    board = Board(parser.rows())
+
+    # Entities are ordered as they appear in file
+    entities = [
+        ENTITY_MAP[symbol]((row, col), health, speed, strength)
+        for symbol, row, col, health, speed, strength in parser.entities()
+    ]
+    return BreachModel(board, entities)
+
+
+def level_from_save(
+    save: tuple[
+        tuple[int, int], bytes, bytes, 
+        list[tuple[str, int, int, int, int, int]]
+    ],
+    source: str = "save",
+) -> BreachModel:
+    """
+    Builds a game state from the contents of a binary save, as returned by 
+    read_save or decode_save.
+
+    Args:
+        save (tuple): The dimensions, tile kinds, building health and entity
+                      records of the game state
+        source (str): Name of where the save came from, for error messages.
+                      Optional: Defaults to "save".
+
+    Returns:
+        BreachModel: The game state described by the save
+
+    Raises:
+        IOError: If an entity has an unknown symbol, or is outside the board
+                 or on a mountain
+    """
+    dimensions, tile_kinds, building_health, records = save
+    board = Board.from_tile_kinds(dimensions, tile_kinds, building_health)
+    height, width = dimensions
+
+    entities = []
+    for symbol, row, col, health, speed, strength in records:
+        if symbol not in ENTITY_MAP:
+            raise IOError(f"{source} has unknown entity symbol {symbol!r}")
+        if not (0 <= row < height and 0 <= col < width):
+            raise IOError(f"{source} has an entity outside the board at "
+                          f"{(row, col)}")
+        # Buildings are not checked, as healing can restore a destroyed 
+        # building beneath an entity
+        if board.get_tile((row, col)).get_tile_name() == MOUNTAIN_NAME:
+            raise IOError(f"{source} has an entity on a mountain at "
+                          f"{(row, col)}")
+        entities.append(
+            ENTITY_MAP[symbol]((row, col), health, speed, strength)
         )
+    return BreachModel(board, entities)
 
-        self._banner.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
-        self._grid.pack(side=tk.LEFT, expand=tk.TRUE, fill=tk.BOTH)
-        self._sidebar.pack(side=tk.LEFT, expand=tk.TRUE, fill=tk.BOTH)
-        self._game_frame.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
-        self._control_bar.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
 
-    def bind_click_callback(self,
-            click_callback: Callable[[tuple[int, int]], None]) -> None:
-        """
-        Binds a callback that will be called when the user clicks anywhere on 
-        the board
+def level_from_bytes(data: bytes, source: str = "level") -> BreachModel:
+    """
+    Builds a game state from the contents of a level file in either format.
 
-        Args:
-            click_callback (Callable[[tuple[int, int]], None]): Callback to be 
-                                                                bound to the 
-                                                                board display
-        """
-        self._grid.bind_click_callback(click_callback)
+    Args:
+        data (bytes): The contents of a text level or binary save
+        source (str): Name of where the data came from, for error messages.
+                      Optional: Defaults to "level".
 
-    def redraw(
-        self,
-        board: Board,
-        entities: list[Entity],
-        highlighted: Optional[list[tuple[int, int]]] = None,
-        movement: bool = False,
-    ) -> None:
-        """
-        Redraws the view based on the given board state and list of entities.
+    Returns:
+        BreachModel: The game state described by the data
 
-        Args:
-            board (Board): The current board state
-            entities (list[Entity]): The list of current entities
+    Raises:
+        IOError: If the data is not a valid level
+    """
+    if data.startswith(MAGIC):
+        return level_from_save(decode_save(data, source), source)
+    try:
+        text = data.decode()
+    except UnicodeDecodeError as e:
+        raise IOError(f"{source} is not a text level: {e}") from None
+    return level_from_lines(text.splitlines())
+
+
+def read_level(
+    file_path: str, 
+    level: Optional[Union[int, str]] = None,
+) -> BreachModel:
+    """
+    Reads a game state from a file without using the level cache. Both the
+    text format and the binary format written by save_level are read, as 
+    well as levels inside level packs. Autosave journals are not applied, 
+    see load_autosave.
+
+    Args:
+        file_path (str): file from which to load the game state.
+        level (Optional[Union[int, str]]): If given, file_path is a level 
+                                           pack, and this is the position or
+                                           name of the level to load. 
+                                           Optional: Defaults to None.
+
+    Returns:
+        BreachModel: The game state described by the file
+
+    Raises:
+        IOError: If the file cannot be read, or the pack has no such level
+    """
+    if level is not None:
+        with LevelPack(file_path) as pack:
+            try:
+                data = pack.read(level)
+            except (IndexError, KeyError):
+                raise IOError(f"{file_path} has no level {level!r}") from None
+        return level_from_bytes(data, f"{file_path} level {level!r}")
+
+    if not is_binary_save(file_path):
+        return load_text_level(file_path)
+    return level_from_save(read_save(file_path), file_path)
+
+
+def load_autosave(file_path: str) -> BreachModel:
+    """
+    Loads a game state written by an Autosaver, including the changes in its
+    journal. Autosaves change often, so they are not kept in the level cache.
+
+    Args:
+        file_path (str): The autosave file
+
+    Returns:
+        BreachModel: The autosaved game state
+
+    Raises:
+        IOError: If the autosave cannot be read
+    """
+    return level_from_save(read_autosave(file_path), file_path)
+
+
+class LevelCache:
+    """
+    A bounded cache of parsed levels, which evicts the least recently used 
+    level when full. Levels are keyed by their path and the modification 
+    time and size of the file, so a changed file is read again.
+
+    Cached game states are templates that are never handed out. Each load 
+    returns a copy, which shares the template's unchanging tiles.
+    """
+    def __init__(self, max_size: int = LEVEL_CACHE_SIZE) -> None:
+        """
+        Creates an empty cache
+
+        Args:
+            max_size (int): Number of levels to keep. Optional: Defaults to 
+                            LEVEL_CACHE_SIZE.
+        """
+        self._max_size = max_size
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(
+        self, 
+        file_path: str, 
+        level: Optional[Union[int, str]] = None,
+    ) -> BreachModel:
+        """
+        Returns a new game state for a level, reading the file only if it is
+        not cached or has changed since it was cached.
+
+        Args:
+            file_path (str): file from which to load the game state.
+            level (Optional[Union[int, str]]): Position or name of the level
+                                               to load if file_path is a 
+                                               level pack. Optional: 
+                                               Defaults to None.
+
+        Returns:
+            BreachModel: A fresh copy of the level's game state
+
+        Raises:
+            IOError: If the file cannot be read, or the pack has no such level
+        """
+        status = os.stat(file_path)
+        name = (os.path.abspath(file_path), level)
+        key = name + (status.st_mtime_ns, status.st_size)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+
+        if template is None:
+            template = read_level(file_path, level)
+            with self._lock:
+                # Older versions of the same level will not be used again
+                for old_key in [old_key for old_key in self._templates 
+                                if old_key[:2] == name]:
+                    del self._templates[old_key]
+                self._templates[key] = template
+                while len(self._templates) > self._max_size:
+                    self._templates.popitem(last=False)
+
+        return template.copy()
+
+    def clear(self) -> None:
+        """
+        Removes every cached level
+        """
+        with self._lock:
+            self._templates.clear()
+
+
+_level_cache = LevelCache()
+
+
+def load_level(
+    file_path: str, 
+    level: Optional[Union[int, str]] = None,
+) -> BreachModel:
+    """
+    Loads a game state from a file, without requiring a running GUI. Both 
+    the text format and the binary format written by save_level are read, 
+    as well as levels inside level packs. Parsed levels are kept in a shared
+    LevelCache, so loading an unchanged level again only copies it.
+
+    Args:
+        file_path (str): file from which to load the game state.
+        level (Optional[Union[int, str]]): If given, file_path is a level 
+                                           pack, and this is the position or
+                                           name of the level to load. 
+                                           Optional: Defaults to None.
+
+    Returns:
+        BreachModel: The game state described by the file
+
+    Raises:
+        IOError: If the file cannot be read, or the pack has no such level
+    """
+    return _level_cache.load(file_path, level)
+
+
+def save_level(model: BreachModel, file_path: str) -> None:
+    """
+    Saves a game state to a file. Files ending in BINARY_SAVE_EXTENSION are 
+    written in the binary format, and all others in the text format.
+
+    Args:
+        model (BreachModel): The game state to save
+        file_path (str): file to write the game state to
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    if not file_path.endswith(BINARY_SAVE_EXTENSION):
+        with open(file_path, 'w') as f:
+            model.write_to(f)
+        return
+
+    with open(file_path, 'wb') as f:
+        f.write(level_to_bytes(model))
+
+
+def level_to_bytes(model: BreachModel) -> bytes:
+    """
+    Encodes a game state in the binary format, as read by level_from_bytes
+
+    Args:
+        model (BreachModel): The game state to encode
+
+    Returns:
+        bytes: The encoded game state
+    """
+    board = model.get_board()
+    return encode_save(
+        board.get_dimensions(),
+        board.get_tile_kinds(),
+        board.get_building_health(),
+        entity_records(model.get_entities()),
+    )
+
+
+def entity_records(
+    entities: list[Entity],
+) -> list[tuple[str, int, int, int, int, int]]:
+    """
+    Returns the values each entity would be constructed from, as stored by 
+    the binary format
+
+    Args:
+        entities (list[Entity]): The entities to describe
+
+    Returns:
+        list[tuple[str, int, int, int, int, int]]: The (symbol, row, column,
+            health, speed, strength) of each entity
+    """
+    # Text records hold the values each entity is constructed from
+    return [
+        (symbol, *map(int, values))
+        for symbol, *values in (str(entity).split(",") for entity in entities)
+    ]
+
+
+# VIEW ----------------------------------------------------------------------#
+
+# Maps model symbols to their view counterparts
+SYMBOL_MAP = {
+    TANK_SYMBOL: TANK_DISPLAY,
+    HEAL_SYMBOL: HEAL_DISPLAY,
+    SCORPION_SYMBOL: SCORPION_DISPLAY,
+    FIREFLY_SYMBOL: FIREFLY_DISPLAY,
+}
+SIDEBAR_COLS = 4
+SIDEBAR_ROW_HEIGHT = 24  # minimum height of a sidebar row in pixels
+SIDEBAR_SCROLL_ROWS = 3  # rows scrolled per mouse wheel step
+
+# Minimum number of milliseconds between two paints of the view
+REDRAW_INTERVAL = 16
+
+# Enemy movement playback, in milliseconds
+ANIMATION_STEP_TIME = 120  # time taken to move one tile
+ANIMATION_FRAME_INTERVAL = 16
+
+# Milliseconds between checks for results of background computations
+WORKER_POLL_INTERVAL = 20
+WORKER_ERROR_TITLE = "Internal Error"
+WORKER_ERROR_MESSAGE = "A background computation failed: "
+
+# Autosave, written in the binary format on a worker thread. Games only 
+# autosave when given a file, and main uses one in the user's home directory.
+AUTOSAVE_FILE = os.path.join(os.path.expanduser("~"), ".into_the_breach", 
+                             "autosave" + BINARY_SAVE_EXTENSION)
+AUTOSAVE_INTERVAL = 30000  # milliseconds between autosaves
+AUTOSAVE_ERROR_MESSAGE = "Autosave has been turned off: "
+
+# Canvas tags for the layers of the game grid, from bottom to top
+TERRAIN_TAG = "terrain"
+HIGHLIGHT_TAG = "highlight"
+PREVIEW_TAG = "preview"
+
+# Hover preview of movement ranges
+HOVER_DELAY = 40  # milliseconds the pointer must rest on a cell
+PREVIEW_WIDTH = 3  # outline width of previewed cells
+
+# Game grid camera
+MIN_CELL_SIZE = 8  # pixels per cell at a zoom of 1, for boards too big to fit
+ZOOM_STEP = 1.25
+MIN_ZOOM = 0.25
+MAX_ZOOM = 8.0
+
+# Boards with more cells than this draw their terrain into a single image
+IMAGE_TERRAIN_CELLS = 1600
+
+
+class BreachView:
+    """
+    Manages the view of a game of Into The Breach
+    """
+    def __init__(
+        self,
+        root: tk.Tk,
+        board_dims: tuple[
+            int, int
+        ],
+        save_callback: Optional[Callable[[], None]],
+        load_callback: Optional[Callable[[], None]],
+        turn_callback: Optional[Callable[[], None]],
+    ) -> None:
+        """
+        Creates a view of a game of Into The Breach.
+
+        Args:
+            root (tk.Tk): root window
+            board_dims (tuple[ int, int ]): initial board dimensions to display
+            save_callback (Optional[Callable[[], None]]): Callback that should 
+                                                          be called when the 
+                                                          user clicks the 
+                                                          "Save Game" button
+            load_callback (Optional[Callable[[], None]]): Callback that should 
+                                                          be called when the 
+                                                          user clicks the 
+                                                          "Load Game" button
+            turn_callback (Optional[Callable[[], None]]): Callback that should 
+                                                          be called when the 
+                                                          user clicks the 
+                                                          "End Turn" button
+        """
+        root.title(BANNER_TEXT)
+
+        self._banner = tk.Label(
+            root, text=BANNER_TEXT, font=BANNER_FONT
+        )  # width and height arguments are different for Label, dont specify.
+        self._game_frame = tk.Frame(root)
+        self._grid = GameGrid(
+            self._game_frame, board_dims, (GRID_SIZE, GRID_SIZE)
+        )
+        self._sidebar = SideBar(
+            self._game_frame, (1, SIDEBAR_COLS), (SIDEBAR_WIDTH, GRID_SIZE)
+        )
+        self._control_bar = ControlBar(
+            root,
+            save_callback,
+            load_callback,
+            turn_callback,
+            width=GRID_SIZE + SIDEBAR_WIDTH,
+            height=CONTROL_BAR_HEIGHT,
+        )
+
+        self._banner.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
+        self._grid.pack(side=tk.LEFT, expand=tk.TRUE, fill=tk.BOTH)
+        self._sidebar.pack(side=tk.LEFT, expand=tk.TRUE, fill=tk.BOTH)
+        self._game_frame.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
+        self._control_bar.pack(side=tk.TOP, expand=tk.TRUE, fill=tk.BOTH)
+
+    def bind_click_callback(self,
+            click_callback: Callable[[tuple[int, int]], None]) -> None:
+        """
+        Binds a callback that will be called when the user clicks anywhere on 
+        the board
+
+        Args:
+            click_callback (Callable[[tuple[int, int]], None]): Callback to be 
+                                                                bound to the 
+                                                                board display
+        """
+        self._grid.bind_click_callback(click_callback)
+
+    def bind_hover_callback(self, 
+            hover_callback: Callable[[Optional[tuple[int, int]]], None]) -> None:
+        """
+        Binds a callback that will be called when the pointer comes to rest on
+        a cell of the board, or leaves the board
+
+        Args:
+            hover_callback (Callable[[Optional[tuple[int, int]]], None]): 
+                Callback to be bound to the board display. Receives the 
+                hovered cell, or None once the pointer leaves the board.
+        """
+        self._grid.bind_hover_callback(hover_callback)
+
+    def redraw(
+        self,
+        board: Board,
+        entities: list[Entity],
+        highlighted: Optional[list[tuple[int, int]]] = None,
+        movement: bool = False,
+    ) -> None:
+        """
+        Redraws the view based on the given board state and list of entities.
+
+        Args:
+            board (Board): The current board state
+            entities (list[Entity]): The list of current entities
             highlighted (Optional[list[tuple[int, int]]]): List of tiles that 
                                                            should be 
                                                            highlighted. 
@@ -888,11 +1838,241 @@ class BreachView:
         self._grid.redraw(board, entities, highlighted, movement)
         self._sidebar.display(entities)
 
+    def highlight(
+        self,
+        highlighted: Optional[list[tuple[int, int]]] = None,
+        movement: bool = False,
+    ) -> None:
+        """
+        Changes only the highlighted tiles of the view.
+
+        Args:
+            highlighted (Optional[list[tuple[int, int]]]): List of tiles that 
+                                                           should be 
+                                                           highlighted. 
+                                                           Optional: Defaults
+                                                           None.
+            movement (bool): True if highlight represents valid movement 
+                             positions. False if highlight represents attack 
+                             targets. Optional: Defaults to False.
+        """
+        self._grid.highlight(highlighted, movement)
+
+    def preview(self, positions: Optional[list[tuple[int, int]]]) -> None:
+        """
+        Changes only the tiles outlined as a preview of a movement range.
+
+        Args:
+            positions (Optional[list[tuple[int, int]]]): Tiles to outline, or 
+                                                         None for no preview
+        """
+        self._grid.preview(positions)
+
+    def animate_movements(
+        self, 
+        movements: list[tuple[Entity, list[tuple[int, int]]]],
+    ) -> None:
+        """
+        Plays back entity movements on the board. The view must already show
+        the entities at the end of their paths.
+
+        Args:
+            movements (list[tuple[Entity, list[tuple[int, int]]]]): Each 
+                moving entity with the path it took
+        """
+        self._grid.animate(movements)
+
+    def stop_animation(self) -> None:
+        """
+        Drops any remaining frames of movement playback, showing entities at
+        their current positions
+        """
+        self._grid.stop_animation()
+
+    def set_busy(self, busy: bool) -> None:
+        """
+        Shows whether the game is waiting for a turn to be resolved, during 
+        which the board and the save and end turn buttons are disabled.
+
+        Args:
+            busy (bool): True while a turn is being resolved
+        """
+        self._control_bar.set_busy(busy)
+        self._grid.configure(cursor="watch" if busy else "")
+
 
 class GameGrid(AbstractGrid):
     """
     View component that displays board state for a game of Into The Breach.
+
+    The grid shows the board through a camera that can be zoomed with the 
+    mouse wheel and panned by dragging with the right mouse button, so 
+    boards larger than the window stay usable. Only cells inside the 
+    viewport have canvas items. Boards with more than IMAGE_TERRAIN_CELLS 
+    cells draw their visible terrain into one PhotoImage instead of a 
+    rectangle per cell.
+
+    Canvas items are retained between redraws. A rectangle for every visible
+    cell is created once, and later redraws only reconfigure the cells and 
+    labels that changed and move the entities that moved. Highlighted 
+    cells are drawn as a separate overlay layer above the terrain, so 
+    changing the highlight never touches the terrain.
     """
+    def __init__(
+        self, 
+        master: tk.Widget, 
+        dimensions: tuple[int, int], 
+        size: tuple[int, int],
+        **kwargs
+    ) -> None:
+        """
+        Construct a new game grid
+
+        Args:
+            master (tk.Widget): Widget that the grid should be packed into
+            dimensions (tuple[int, int]): initial (#rows, #columns) to display
+            size (tuple[int, int]): (width, height) of the grid in pixels
+        """
+        super().__init__(master, dimensions, size, **kwargs)
+        self._board = None
+        self._entities = []
+        self._cells = {}  # position -> (rectangle id, color)
+        self._building_labels = {}  # position -> (text id, text)
+        self._entity_labels = {}  # entity -> (text id, position, symbol)
+        self._highlighted = set()
+        self._highlights = {}  # position -> rectangle id
+        self._highlight_color = None
+        self._previewed = set()
+        self._previews = {}  # position -> rectangle id
+
+        # Hover tracking, debounced by HOVER_DELAY
+        self._hover_callback = None
+        self._hover_cell = None
+        self._hover_job = None
+
+        # Label fonts, by (text, font, cell size) and by font description
+        self._label_fonts = {}
+        self._fonts = {}
+
+        # Image terrain layer, used instead of rectangles on large boards
+        self._terrain_image = None
+        self._terrain_item = None
+        self._terrain_range = None  # (rows, columns) drawn into the image
+
+        # Camera, as a zoom factor and the pixel offset of the viewport
+        self._zoom = 1.0
+        self._camera = (0, 0)
+        self._pan_start = None
+
+        # Movement playback
+        self._animation = []  # (entity, path) of each moving entity
+        self._animation_length = 0  # steps in the longest path
+        self._animation_start = None
+        self._animation_job = None
+
+        self.bind("<MouseWheel>", 
+                  lambda e: self._zoom_at(e.x, e.y, e.delta > 0))
+        self.bind("<Button-4>", lambda e: self._zoom_at(e.x, e.y, True))
+        self.bind("<Button-5>", lambda e: self._zoom_at(e.x, e.y, False))
+        self.bind("<Button-3>", self._start_pan)
+        self.bind("<B3-Motion>", self._drag_pan)
+
+    def _get_cell_size(self) -> tuple[int, int]:
+        rows, cols = self._dimensions
+        width, height = self._size
+        return (
+            max(1, round(max(MIN_CELL_SIZE, width // cols) * self._zoom)),
+            max(1, round(max(MIN_CELL_SIZE, height // rows) * self._zoom)),
+        )
+
+    def pixel_to_cell(self, x: int, y: int) -> tuple[int, int]:
+        cell_width, cell_height = self._get_cell_size()
+        camera_x, camera_y = self._camera
+        return (y + camera_y) // cell_height, (x + camera_x) // cell_width
+
+    def _get_bbox(self, position: tuple[int, int]) -> tuple[int, int, int, int]:
+        row, col = position
+        cell_width, cell_height = self._get_cell_size()
+        camera_x, camera_y = self._camera
+        x_min = col * cell_width - camera_x
+        y_min = row * cell_height - camera_y
+        return x_min, y_min, x_min + cell_width, y_min + cell_height
+
+    def _get_midpoint(self, position: tuple[int, int]) -> tuple[int, int]:
+        x_min, y_min, x_max, y_max = self._get_bbox(position)
+        return (x_min + x_max) // 2, (y_min + y_max) // 2
+
+    def _get_visible_range(self) -> tuple[range, range]:
+        """
+        (tuple[range, range]) Returns the rows and columns of the board that 
+        are at least partly inside the viewport
+        """
+        rows, cols = self._dimensions
+        cell_width, cell_height = self._get_cell_size()
+        camera_x, camera_y = self._camera
+        width, height = self._size
+        return (
+            range(max(0, camera_y // cell_height),
+                  min(rows, (camera_y + height) // cell_height + 1)),
+            range(max(0, camera_x // cell_width),
+                  min(cols, (camera_x + width) // cell_width + 1)),
+        )
+
+    def _get_label_font(self, text: str) -> tkfont.Font:
+        """
+        Returns the font that a label is drawn with, which is ENTITY_FONT 
+        shrunk until the label fits in a cell. Fonts are measured once per 
+        (text, font, cell size) and shared between labels of the same size.
+
+        Args:
+            text (str): The text of the label
+
+        Returns:
+            tkfont.Font: The font to draw the label with
+        """
+        cell_size = self._get_cell_size()
+        key = (text, ENTITY_FONT, cell_size)
+        font = self._label_fonts.get(key)
+        if font is not None:
+            return font
+
+        family, size, *style = ENTITY_FONT
+        cell_width, cell_height = cell_size
+        size = min(size, max(1, min(cell_size) * 2 // 3))
+        font = self._get_font((family, size, *style))
+        while size > 1 and (font.measure(text) > cell_width 
+                            or font.metrics("linespace") > cell_height):
+            size -= 1
+            font = self._get_font((family, size, *style))
+        self._label_fonts[key] = font
+        return font
+
+    def _get_font(self, description: tuple) -> tkfont.Font:
+        """
+        (tkfont.Font) Returns the shared font object for a font description
+        """
+        font = self._fonts.get(description)
+        if font is None:
+            font = tkfont.Font(self, font=description)
+            self._fonts[description] = font
+        return font
+
+    def _evict_label_fonts(self) -> None:
+        """
+        Discards cached fonts measured for a cell size other than the 
+        current one
+        """
+        cell_size = self._get_cell_size()
+        self._label_fonts = {
+            key: font for key, font in self._label_fonts.items()
+            if key[2] == cell_size
+        }
+        used = {id(font) for font in self._label_fonts.values()}
+        self._fonts = {
+            description: font for description, font in self._fonts.items()
+            if id(font) in used
+        }
+
     def bind_click_callback(self, 
                     click_callback: Callable[[tuple[int, int]], None]) -> None:
         """
@@ -907,6 +2087,47 @@ class GameGrid(AbstractGrid):
         self.bind("<Button-1>", on_click)
         self.bind("<Button-2>", on_click)  # NOTE: BIND BOTH FOR MACS
 
+    def bind_hover_callback(self, 
+            hover_callback: Callable[[Optional[tuple[int, int]]], None]) -> None:
+        """
+        Binds a callback that will be called once the pointer has rested on a
+        cell for HOVER_DELAY milliseconds, or has left the board. Motion 
+        within a cell, and motion that passes over a cell quickly, does not 
+        call the callback.
+
+        Args:
+            hover_callback (Callable[[Optional[tuple[int, int]]], None]): 
+                Callback to be bound to board. Receives the hovered cell, or 
+                None once the pointer leaves the board.
+        """
+        self._hover_callback = hover_callback
+        self.bind("<Motion>", 
+                  lambda e: self._hover(self.pixel_to_cell(e.x, e.y)))
+        self.bind("<Leave>", lambda e: self._hover(None))
+
+    def _hover(self, cell: Optional[tuple[int, int]]) -> None:
+        """
+        Restarts the hover delay whenever the pointer enters another cell
+        """
+        rows, cols = self._dimensions
+        if cell is not None \
+                and not (0 <= cell[0] < rows and 0 <= cell[1] < cols):
+            cell = None
+        if cell == self._hover_cell:
+            return
+
+        self._hover_cell = cell
+        if self._hover_job is not None:
+            self.after_cancel(self._hover_job)
+        self._hover_job = self.after(HOVER_DELAY, self._end_hover_delay)
+
+    def _end_hover_delay(self) -> None:
+        """
+        Reports the cell the pointer has come to rest on
+        """
+        self._hover_job = None
+        self._hover_callback(self._hover_cell)
+
     def redraw(
         self,
         board: Board,
@@ -929,49 +2150,461 @@ class GameGrid(AbstractGrid):
                              positions. False if highlight represents attack 
                              targets. Optional: Defaults to False.
         """
-        self.clear()
+        if self._board is None or board.get_dimensions() != self._dimensions:
+            self._build(board)
+        else:
+            # Boards of the same size, such as a copy of the shown board 
+            # advanced by a turn, are shown by updating the cells that differ
+            self._board = board
+        self._entities = entities
+
+        # Update the visible board, only touching cells that changed
+        for cell, (rectangle, color) in self._cells.items():
+            tile = board.get_tile(cell)
+            new_color = self._get_tile_color(tile)
+            if new_color != color:
+                if rectangle is None:
+                    self._paint_terrain_cell(cell, new_color)
+                else:
+                    self.itemconfigure(rectangle, fill=new_color)
+                self._cells[cell] = (rectangle, new_color)
+
+            # Annotate buildings that are still standing
+            if tile.get_tile_name() == BUILDING_NAME:
+                self._update_building_label(cell, tile)
+
+        self._update_entity_labels()
+        self.highlight(highlighted, movement)
 
+    def highlight(
+        self, 
+        highlighted: Optional[list[tuple[int, int]]] = None, 
+        movement: bool = False,
+    ) -> None:
+        """
+        Replaces the highlighted cells, adding and removing only the overlay
+        items that differ from the current highlight.
+
+        Args:
+            highlighted (Optional[list[tuple[int, int]]]): List of tiles that 
+                                                           should be 
+                                                           highlighted. 
+                                                           Optional: Defaults
+                                                           None.
+            movement (bool): True if highlight represents valid movement 
+                             positions. False if highlight represents attack 
+                             targets. Optional: Defaults to False.
+        """
         # See if move or attack highlight
         highlight_color = ATTACK_COLOR
         if movement:
             highlight_color = MOVE_COLOR
 
-        # Display Board
-        height, width = board.get_dimensions()
-        self.set_dimensions((height, width))
-        for row in range(height):
-            for col in range(width):
+        self._highlighted = set(highlighted or ())
+        if self._highlights and highlight_color != self._highlight_color:
+            self.itemconfigure(HIGHLIGHT_TAG, fill=highlight_color)
+        self._highlight_color = highlight_color
+        self._update_highlights()
+
+    def _update_highlights(self) -> None:
+        """
+        Adds and removes overlay items so that exactly the visible 
+        highlighted cells are covered
+        """
+        cells = self._highlighted & self._cells.keys()
+        for cell in self._highlights.keys() - cells:
+            self.delete(self._highlights.pop(cell))
+
+        new_cells = cells - self._highlights.keys()
+        for cell in new_cells:
+            self._highlights[cell] = self.create_rectangle(
+                *self._get_bbox(cell), fill=self._highlight_color, 
+                tags=HIGHLIGHT_TAG
+            )
+        if new_cells:
+            # Keep the overlay between the terrain and the labels
+            self.tag_raise(HIGHLIGHT_TAG, TERRAIN_TAG)
+
+    def preview(self, positions: Optional[list[tuple[int, int]]]) -> None:
+        """
+        Replaces the cells outlined as a preview, on an overlay layer above 
+        the highlight. Only overlay items that differ are added or removed.
+
+        Args:
+            positions (Optional[list[tuple[int, int]]]): Tiles to outline, or 
+                                                         None for no preview
+        """
+        self._previewed = set(positions or ())
+        self._update_preview()
+
+    def _update_preview(self) -> None:
+        """
+        Adds and removes outline items so that exactly the visible previewed
+        cells are outlined
+        """
+        cells = self._previewed & self._cells.keys()
+        for cell in self._previews.keys() - cells:
+            self.delete(self._previews.pop(cell))
+
+        new_cells = cells - self._previews.keys()
+        for cell in new_cells:
+            self._previews[cell] = self.create_rectangle(
+                *self._get_bbox(cell), outline=MOVE_COLOR, 
+                width=PREVIEW_WIDTH, tags=PREVIEW_TAG
+            )
+        if new_cells:
+            # Keep the outlines above the highlight but below the labels
+            self.tag_raise(PREVIEW_TAG, TERRAIN_TAG)
+            if self._highlights:
+                self.tag_raise(PREVIEW_TAG, HIGHLIGHT_TAG)
+
+    def _build(self, board: Board) -> None:
+        """
+        Shows a new board, resetting the camera
+
+        Args:
+            board (Board): The board to display
+        """
+        self.stop_animation()
+        self._board = board
+        self._entities = []
+        self._highlighted = set()
+        self._previewed = set()
+        self.set_dimensions(board.get_dimensions())
+        self._zoom = 1.0
+        self._camera = (0, 0)
+
+        rows, cols = self._dimensions
+        if rows * cols > IMAGE_TERRAIN_CELLS:
+            if self._terrain_image is None:
+                self._terrain_image = tk.PhotoImage(master=self)
+        else:
+            self._terrain_image = None
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """
+        Discards all canvas items and recreates those of the visible cells
+        """
+        self.clear()
+        self._cells = {}
+        self._building_labels = {}
+        self._entity_labels = {}
+        self._highlights = {}
+        self._previews = {}
+        self._evict_label_fonts()
+        if self._terrain_image is not None:
+            self._terrain_item = self.create_image(
+                0, 0, image=self._terrain_image, anchor=tk.NW, 
+                tags=TERRAIN_TAG
+            )
+            self._terrain_range = None
+        self._sync_visible()
+        self._update_entity_labels()
+        self._update_highlights()
+        self._update_preview()
+
+    def _sync_visible(self) -> None:
+        """
+        Deletes the terrain items of cells that left the viewport and creates
+        those of cells that entered it
+        """
+        rows, cols = self._get_visible_range()
+        for cell in list(self._cells):
+            if cell[0] not in rows or cell[1] not in cols:
+                rectangle, _ = self._cells.pop(cell)
+                if rectangle is not None:
+                    self.delete(rectangle)
+                if cell in self._building_labels:
+                    self.delete(self._building_labels.pop(cell)[0])
+
+        created = False
+        for row in rows:
+            for col in cols:
                 cell = (row, col)
-                tile = board.get_tile(cell)
-                if highlighted and cell in highlighted:
-                    self.color_cell(cell, highlight_color)
-                else:
-                    # Color tile based on type
-                    if tile.get_tile_name() == GROUND_NAME:
-                        self.color_cell(cell, GROUND_COLOR)
-                    elif tile.get_tile_name() == MOUNTAIN_NAME:
-                        self.color_cell(cell, MOUNTAIN_COLOR)
-                    elif tile.get_tile_name() == BUILDING_NAME:
-                        building_color = BUILDING_COLOR
-                        if tile.is_destroyed():
-                            building_color = DESTROYED_COLOR
-                        self.color_cell(cell, building_color)
-
-                # Annotate buildings that are still standing
-                if tile.get_tile_name() == BUILDING_NAME \
-                        and not tile.is_destroyed():
-                    self.annotate_position(cell, str(tile), ENTITY_FONT)
-
-        # Display entities on top of board
-        for entity in entities:
+                if cell in self._cells:
+                    continue
+                tile = self._board.get_tile(cell)
+                color = self._get_tile_color(tile)
+                rectangle = None
+                if self._terrain_image is None:
+                    rectangle = self.create_rectangle(
+                        *self._get_bbox(cell), fill=color, tags=TERRAIN_TAG
+                    )
+                self._cells[cell] = (rectangle, color)
+                if tile.get_tile_name() == BUILDING_NAME:
+                    self._update_building_label(cell, tile)
+                created = True
+
+        if self._terrain_image is not None \
+                and (rows, cols) != self._terrain_range:
+            self._paint_terrain(rows, cols)
+        if created:
+            # New terrain must stay below the overlay and labels
+            self.tag_lower(TERRAIN_TAG)
+
+    def _paint_terrain(self, rows: range, cols: range) -> None:
+        """
+        Redraws the terrain image to cover the given cells, writing one row 
+        of cells per put call
+
+        Args:
+            rows (range): The visible rows of the board
+            cols (range): The visible columns of the board
+        """
+        cell_width, cell_height = self._get_cell_size()
+        self._terrain_image.configure(width=len(cols) * cell_width, 
+                                      height=len(rows) * cell_height)
+        for index, row in enumerate(rows):
+            line = " ".join(
+                " ".join([self._cells[(row, col)][1]] * cell_width)
+                for col in cols
+            )
+            self._terrain_image.put(
+                " ".join(["{" + line + "}"] * cell_height), 
+                to=(0, index * cell_height)
+            )
+
+        self._terrain_range = (rows, cols)
+        if rows and cols:
+            x_min, y_min, _, _ = self._get_bbox((rows.start, cols.start))
+            self.coords(self._terrain_item, x_min, y_min)
+
+    def _paint_terrain_cell(self, cell: tuple[int, int], color: str) -> None:
+        """
+        Fills a single cell of the terrain image with a colour
+
+        Args:
+            cell (tuple[int, int]): The visible cell to recolour
+            color (str): The new colour of the cell
+        """
+        rows, cols = self._terrain_range
+        cell_width, cell_height = self._get_cell_size()
+        x_min = (cell[1] - cols.start) * cell_width
+        y_min = (cell[0] - rows.start) * cell_height
+        self._terrain_image.put(
+            color, to=(x_min, y_min, x_min + cell_width, y_min + cell_height)
+        )
+            
+    def _move_camera(self, camera: tuple[int, int]) -> None:
+        """
+        Moves the viewport, keeping it within the board where possible
+
+        Args:
+            camera (tuple[int, int]): New pixel offset of the viewport
+        """
+        rows, cols = self._dimensions
+        cell_width, cell_height = self._get_cell_size()
+        width, height = self._size
+        camera = (
+            max(0, min(camera[0], cols * cell_width - width)),
+            max(0, min(camera[1], rows * cell_height - height)),
+        )
+        d_x = self._camera[0] - camera[0]
+        d_y = self._camera[1] - camera[1]
+        if d_x or d_y:
+            self._camera = camera
+            self.move("all", d_x, d_y)
+            self._sync_visible()
+            self._update_entity_labels()
+            self._update_highlights()
+            self._update_preview()
+
+    def _start_pan(self, event: tk.Event) -> None:
+        """
+        Starts dragging the viewport from the pointer position
+        """
+        self._pan_start = (event.x, event.y)
+
+    def _drag_pan(self, event: tk.Event) -> None:
+        """
+        Drags the viewport so that the board follows the pointer
+        """
+        if self._pan_start is None or self._board is None:
+            return
+        start_x, start_y = self._pan_start
+        self._pan_start = (event.x, event.y)
+        self._move_camera((self._camera[0] + start_x - event.x,
+                           self._camera[1] + start_y - event.y))
+
+    def _zoom_at(self, x: int, y: int, zoom_in: bool) -> None:
+        """
+        Zooms in or out by one step, keeping the point under the pointer fixed
+
+        Args:
+            x (int): The x pixel position of the pointer
+            y (int): The y pixel position of the pointer
+            zoom_in (bool): True to zoom in, False to zoom out
+        """
+        if self._board is None:
+            return
+        zoom = self._zoom * ZOOM_STEP if zoom_in else self._zoom / ZOOM_STEP
+        zoom = max(MIN_ZOOM, min(zoom, MAX_ZOOM))
+        old_width, old_height = self._get_cell_size()
+        self._zoom = zoom
+        new_width, new_height = self._get_cell_size()
+        if (new_width, new_height) == (old_width, old_height):
+            return
+
+        # Items are rebuilt at the new size, so the camera is set directly
+        self._camera = (
+            (self._camera[0] + x) * new_width // old_width - x,
+            (self._camera[1] + y) * new_height // old_height - y,
+        )
+        rows, cols = self._dimensions
+        width, height = self._size
+        self._camera = (
+            max(0, min(self._camera[0], cols * new_width - width)),
+            max(0, min(self._camera[1], rows * new_height - height)),
+        )
+        self._rebuild()
+
+    def animate(
+        self, 
+        movements: list[tuple[Entity, list[tuple[int, int]]]],
+    ) -> None:
+        """
+        Slides the labels of moving entities along their paths. Frames are 
+        scheduled with after() and placed by elapsed time, so slow frames are
+        skipped rather than slowing the playback, and the mainloop is never 
+        blocked.
+
+        Args:
+            movements (list[tuple[Entity, list[tuple[int, int]]]]): Each 
+                moving entity with the path it took. Entities are expected to 
+                be drawn at the end of their paths already.
+        """
+        self.stop_animation()
+        self._animation = [
+            (entity, path) for entity, path in movements if len(path) > 1
+        ]
+        if self._animation:
+            self._animation_length = max(
+                len(path) - 1 for _, path in self._animation
+            )
+            self._animation_start = time.monotonic()
+            self._animate_frame()
+
+    def _animate_frame(self) -> None:
+        """
+        Moves every animated label to where it should be at the current time
+        """
+        self._animation_job = None
+        steps = (time.monotonic() - self._animation_start) \
+            * 1000 / ANIMATION_STEP_TIME
+        if steps >= self._animation_length:
+            self.stop_animation()
+            return
+
+        for entity, path in self._animation:
+            # Labels of entities outside the viewport do not exist
+            label = self._entity_labels.get(entity)
+            if label is None:
+                continue
+            step = min(int(steps), len(path) - 1)
+            x, y = self._get_midpoint(path[step])
+            if step < len(path) - 1:
+                next_x, next_y = self._get_midpoint(path[step + 1])
+                fraction = steps - step
+                x += (next_x - x) * fraction
+                y += (next_y - y) * fraction
+            self.coords(label[0], x, y)
+
+        self._animation_job = self.after(ANIMATION_FRAME_INTERVAL, 
+                                         self._animate_frame)
+
+    def stop_animation(self) -> None:
+        """
+        Drops the remaining frames of any playback, moving the labels to the 
+        ends of their paths
+        """
+        if self._animation_job is not None:
+            self.after_cancel(self._animation_job)
+            self._animation_job = None
+        for entity, _ in self._animation:
+            if entity in self._entity_labels:
+                label, position, _ = self._entity_labels[entity]
+                self.coords(label, *self._get_midpoint(position))
+        self._animation = []
+
+    def _get_tile_color(self, tile: Tile) -> str:
+        """
+        (str) Returns the color a tile is displayed with when not highlighted
+        """
+        if tile.get_tile_name() == MOUNTAIN_NAME:
+            return MOUNTAIN_COLOR
+        elif tile.get_tile_name() == BUILDING_NAME:
+            if tile.is_destroyed():
+                return DESTROYED_COLOR
+            return BUILDING_COLOR
+        return GROUND_COLOR
+
+    def _update_building_label(self, cell: tuple[int, int], 
+                               building: Building) -> None:
+        """
+        Shows the health of a standing building, or removes the label of a 
+        destroyed one
+
+        Args:
+            cell (tuple[int, int]): Position of the building
+            building (Building): The building at that position
+        """
+        text = None if building.is_destroyed() else str(building)
+        label, old_text = self._building_labels.get(cell, (None, None))
+        if text == old_text:
+            return
+
+        if text is None:
+            self.delete(label)
+            del self._building_labels[cell]
+        elif label is None:
+            label = self.create_text(self._get_midpoint(cell), text=text, 
+                                     font=self._get_label_font(text))
+            self._building_labels[cell] = (label, text)
+        else:
+            self.itemconfigure(label, text=text, 
+                               font=self._get_label_font(text))
+            self._building_labels[cell] = (label, text)
+
+    def _update_entity_labels(self) -> None:
+        """
+        Moves, creates and deletes entity labels so that they match the 
+        visible entities
+        """
+        rows, cols = self._get_visible_range()
+        old_labels = self._entity_labels
+        self._entity_labels = {}
+        for entity in self._entities:
+            position = entity.get_position()
+            if position[0] not in rows or position[1] not in cols:
+                continue
             symbol = SYMBOL_MAP[entity.get_symbol()]
-            self.annotate_position(entity.get_position(), symbol, ENTITY_FONT)
+            if entity in old_labels:
+                label, old_position, old_symbol = old_labels.pop(entity)
+                if position != old_position:
+                    self.coords(label, *self._get_midpoint(position))
+                if symbol != old_symbol:
+                    self.itemconfigure(label, text=symbol, 
+                                       font=self._get_label_font(symbol))
+            else:
+                label = self.create_text(self._get_midpoint(position), 
+                                         text=symbol, 
+                                         font=self._get_label_font(symbol))
+            self._entity_labels[entity] = (label, position, symbol)
+
+        # Remove labels of entities that are no longer present or visible
+        for label, _, _ in old_labels.values():
+            self.delete(label)
 
 
 class SideBar(AbstractGrid):
     """
     View component that displays the current state of entities for a game 
     of Into The Breach.
+
+    Only as many rows as fit in the sidebar are drawn, and longer entity 
+    lists can be scrolled with the mouse wheel. Text items are kept between
+    redraws, and only the cells of rows whose data changed are updated.
     """
     def __init__(
         self, 
@@ -990,6 +2623,15 @@ class SideBar(AbstractGrid):
                                     pixels
         """
         super().__init__(master, dimensions, size)
+        self._entities = []
+        self._first = 0  # index of the entity shown in the top row
+        self._rows = None  # per visible row: (text ids, texts)
+
+        self.bind("<MouseWheel>", lambda e: self._scroll(
+            -SIDEBAR_SCROLL_ROWS if e.delta > 0 else SIDEBAR_SCROLL_ROWS
+        ))
+        self.bind("<Button-4>", lambda e: self._scroll(-SIDEBAR_SCROLL_ROWS))
+        self.bind("<Button-5>", lambda e: self._scroll(SIDEBAR_SCROLL_ROWS))
 
     def display(self, entities: list[Entity]) -> None:
         """
@@ -1001,24 +2643,58 @@ class SideBar(AbstractGrid):
                                      Entities appear in descending priority 
                                      order
         """
-        self.clear()
-        self.set_dimensions((len(entities) + 1, SIDEBAR_COLS))
+        self._entities = entities
+        max_rows = max(1, self._size[1] // SIDEBAR_ROW_HEIGHT - 1)
+        dimensions = (min(len(entities), max_rows) + 1, SIDEBAR_COLS)
+
+        # Lay out the table again only when the number of rows changes
+        if self._rows is None or dimensions != self._dimensions:
+            self.clear()
+            self.set_dimensions(dimensions)
+            for i, heading in enumerate(SIDEBAR_HEADINGS):
+                self.annotate_position((0, i), heading, SIDEBAR_FONT)
+            self._rows = []
+
+        self._scroll(0)
+
+    def _scroll(self, rows: int) -> None:
+        """
+        Scrolls the entity list and updates the rows that changed
+
+        Args:
+            rows (int): Number of rows to scroll down by, or up by if negative
+        """
+        if self._rows is None:
+            return
+        visible_rows = self._dimensions[0] - 1
+        self._first = max(0, min(self._first + rows, 
+                                 len(self._entities) - visible_rows))
 
-        # Display headings
-        for i, heading in enumerate(SIDEBAR_HEADINGS):
-            self.annotate_position((0, i), heading, SIDEBAR_FONT)
+        visible = self._entities[self._first:self._first + visible_rows]
+        for row, entity in enumerate(visible):
+            texts = [
+                str(property) for property in [
+                    SYMBOL_MAP[entity.get_symbol()],
+                    entity.get_position(),
+                    entity.get_health(),
+                    entity.get_strength()
+                ]
+            ]
+            if row == len(self._rows):
+                labels = [
+                    self.create_text(self._get_midpoint((row + 1, i)), 
+                                     text=text, font=SIDEBAR_FONT)
+                    for i, text in enumerate(texts)
+                ]
+                self._rows.append((labels, texts))
+                continue
 
-        # Display entities
-        for row, entity in enumerate(entities):
-            for i, text in enumerate([
-                    str(property) for property in [
-                        SYMBOL_MAP[entity.get_symbol()],
-                        entity.get_position(),
-                        entity.get_health(),
-                        entity.get_strength()
-                    ]
-            ]):
-                self.annotate_position((row + 1, i), text, SIDEBAR_FONT)
+            labels, old_texts = self._rows[row]
+            if texts != old_texts:
+                for label, text, old_text in zip(labels, texts, old_texts):
+                    if text != old_text:
+                        self.itemconfigure(label, text=text)
+                self._rows[row] = (labels, texts)
 
 
 class ControlBar(tk.Frame):
@@ -1066,23 +2742,76 @@ class ControlBar(tk.Frame):
         self._load_button.pack(side=tk.LEFT, expand=tk.TRUE)
         self._turn_button.pack(side=tk.LEFT, expand=tk.TRUE)
 
+    def set_busy(self, busy: bool) -> None:
+        """
+        Disables the save and end turn buttons while busy. Loading stays 
+        available so that a game can be replaced at any time.
+
+        Args:
+            busy (bool): True to disable the buttons, False to enable them
+        """
+        state = tk.DISABLED if busy else tk.NORMAL
+        self._save_button.configure(state=state)
+        self._turn_button.configure(state=state)
+
 
 # CONTROLLER ----------------------------------------------------------------#
 class IntoTheBreach:
     """
     Controller class that manages a game of Into The Breach
     """
-    def __init__(self, root: tk.Tk, game_file: str) -> None:
+    def __init__(
+        self, 
+        root: tk.Tk, 
+        game_file: str, 
+        autosave_file: Optional[str] = None,
+    ) -> None:
         """
         Initialises a new game of Into the Breach
 
         Args:
             root (tk.Tk): Root window in which to display game
             game_file (str): file from which to load initial game state
+            autosave_file (Optional[str]): file to autosave the game to. 
+                                           Optional: Defaults to None, in 
+                                           which case the game is not 
+                                           autosaved.
         """
         self._root = root
+        self._root.protocol("WM_DELETE_WINDOW", self._quit)
         self._game_file = game_file
+        self._game_level = None  # level within the file, for level packs
         self._model = None
+
+        # Background computations. Each copies the model on its own thread 
+        # and runs on the copy, and its result is passed back through the 
+        # queue along with the generation it was started in. Loading a game 
+        # starts a new generation, which discards the results of 
+        # computations still in flight. The lock keeps the Tk thread from 
+        # changing the model while a worker copies it.
+        self._model_lock = threading.Lock()
+        self._results = queue.Queue()
+        self._generation = 0
+        self._jobs = 0
+        self._poll_job = None
+        self._turn_in_flight = False
+        self._closed = False
+
+        # Movement ranges of mechs, found in the background and kept until 
+        # the game state changes
+        self._movement_ranges = {}  # entity -> positions
+        self._movement_ranges_key = None  # state key the ranges are for
+
+        # States are captured here and written by the autosaver's thread
+        self._autosave_file = autosave_file
+        self._autosaver = None
+        self._autosaved_state = None
+        self._autosave_job = None
+        if autosave_file is not None:
+            self._autosaver = Autosaver(autosave_file)
+            self._autosave_job = self._root.after(AUTOSAVE_INTERVAL, 
+                                                  self._autosave)
+
         self.load_model(game_file)
 
         self._view = BreachView(
@@ -1093,33 +2822,257 @@ class IntoTheBreach:
             turn_callback=self._end_turn,
         )
         self._view.bind_click_callback(self._handle_click)
+        self._view.bind_hover_callback(self._handle_hover)
+        self._hovered = None
 
         self._active_entity = None
+
+        # Redraw scheduling. The painted keys record which game state and 
+        # focussed entity the view currently shows.
+        self._redraw_requested = False
+        self._paint_job = None
+        self._painted_state = None
+        self._painted_highlight = None
         self.redraw()
 
     def redraw(self) -> None:
         """
         Redraws the game based on current game state
         """
-        # Check if we are highlighting anything
-        highlighted = None
-        move = False
-        if self._active_entity:
-            if self._active_entity.is_friendly() \
-                    and self._active_entity.is_active():
-                highlighted = self._model.get_valid_movement_positions(
-                    self._active_entity
-                )
-                move = True
-            else:
-                highlighted = self._active_entity.get_targets()
-
+        self._painted_state = self._get_state_key()
+        self._painted_highlight = self._get_highlight_key()
         self._view.redraw(
             self._model.get_board(), 
             self._model.get_entities(), 
-            highlighted, 
-            move
+            *self._get_highlight()
         )
+        self._show_preview()
+
+    def request_redraw(self) -> None:
+        """
+        Marks the view as out of date. Requests are merged into a single 
+        paint once Tk is idle, and paints happen at most once every 
+        REDRAW_INTERVAL milliseconds.
+        """
+        self._redraw_requested = True
+        if self._paint_job is None:
+            self._paint_job = self._root.after_idle(self._paint)
+
+    def _paint(self) -> None:
+        """
+        Performs a requested paint, skipping any part of the view that 
+        already shows the current state
+        """
+        self._paint_job = None
+        if not self._redraw_requested:
+            return
+        self._redraw_requested = False
+
+        if self._get_state_key() != self._painted_state:
+            self.redraw()
+        elif self._get_highlight_key() != self._painted_highlight:
+            # Only the focussed entity changed
+            self._painted_highlight = self._get_highlight_key()
+            self._view.highlight(*self._get_highlight())
+
+        self._paint_job = self._root.after(REDRAW_INTERVAL, 
+                                           self._end_paint_interval)
+
+    def _end_paint_interval(self) -> None:
+        """
+        Performs any paint requested since the last one
+        """
+        self._paint_job = None
+        if self._redraw_requested:
+            self._paint_job = self._root.after_idle(self._paint)
+
+    def _get_state_key(self) -> tuple[BreachModel, int]:
+        """
+        (tuple[BreachModel, int]) Returns a key that changes whenever the 
+        displayed game state changes. The model's state hash serves as its 
+        version.
+        """
+        return self._model, self._model.state_hash()
+
+    def _get_highlight_key(self) -> tuple:
+        """
+        (tuple) Returns a key that changes whenever the highlighted tiles may
+        change
+        """
+        return self._active_entity, \
+            self._active_entity in self._movement_ranges, \
+            self._get_state_key()
+
+    def _get_highlight(self) -> tuple[Optional[list[tuple[int, int]]], bool]:
+        """
+        (tuple[Optional[list[tuple[int, int]]], bool]) Returns the tiles to 
+        highlight for the focussed entity, and whether they are movement 
+        positions rather than attack targets
+        """
+        if self._active_entity:
+            if self._active_entity.is_friendly() \
+                    and self._active_entity.is_active():
+                # Nothing is highlighted until the worker has found the range
+                return self._get_movement_range(self._active_entity), True
+            return self._active_entity.get_targets(), False
+        return None, False
+
+    def _run_in_background(
+        self,
+        job: Callable[[BreachModel], object],
+        callback: Callable[[BreachModel, object], None],
+        on_error: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Runs a job on a worker thread against a copy of the current model, 
+        which is made on that thread. Once it finishes, the callback is 
+        called on the Tk thread with the copy and the job's result, unless a
+        game has been loaded since. If the job fails, the error is shown 
+        and on_error is called instead.
+
+        Args:
+            job (Callable[[BreachModel], object]): Computation to perform on 
+                                                   the copied model
+            callback (Callable[[BreachModel, object], None]): Receives the 
+                                                              copied model 
+                                                              and result
+            on_error (Optional[Callable[[], None]]): Cleans up after a 
+                                                     failed job. Optional: 
+                                                     Defaults to None.
+        """
+        source = self._model
+        generation = self._generation
+        # The hash is computed lazily, so compute it here rather than while
+        # a worker is copying it
+        source.state_hash()
+
+        def work() -> None:
+            model = result = error = None
+            try:
+                with self._model_lock:
+                    model = source.copy()
+                result = job(model)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            self._results.put((generation, model, callback, on_error, 
+                               result, error))
+
+        threading.Thread(target=work, daemon=True).start()
+        self._jobs += 1
+        if self._poll_job is None:
+            self._poll_job = self._root.after(WORKER_POLL_INTERVAL, 
+                                              self._poll_results)
+
+    def _poll_results(self) -> None:
+        """
+        Passes the results of finished background computations to their 
+        callbacks, and keeps polling while any are still running
+        """
+        self._poll_job = None
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+
+        self._jobs -= len(results)
+        if self._jobs:
+            self._poll_job = self._root.after(WORKER_POLL_INTERVAL, 
+                                              self._poll_results)
+
+        for generation, model, callback, on_error, result, error in results:
+            if self._closed:
+                return  # A callback quit the game
+            if generation != self._generation:
+                continue  # The game was replaced while this was running
+            if error is not None:
+                if on_error is not None:
+                    on_error()
+                messagebox.showerror(WORKER_ERROR_TITLE, 
+                                     WORKER_ERROR_MESSAGE + error)
+                continue
+            callback(model, result)
+
+    def _set_busy(self, busy: bool) -> None:
+        """
+        Records whether a turn is being resolved, disabling input meanwhile
+        """
+        self._turn_in_flight = busy
+        self._view.set_busy(busy)
+
+    def _get_movement_range(
+        self, 
+        entity: Entity,
+    ) -> Optional[list[tuple[int, int]]]:
+        """
+        Returns the valid movement positions of an entity if they have been 
+        found for the current game state. Otherwise starts finding them in 
+        the background, and the view is updated once they are found.
+
+        The ranges of all active mechs are found by one background job per 
+        game state, so the model is copied once per move or turn rather 
+        than once per hover or focus change.
+
+        Args:
+            entity (Entity): A friendly, active entity in the current model
+
+        Returns:
+            Optional[list[tuple[int, int]]]: The cached positions, or None 
+                                             while they are being found
+        """
+        key = self._get_state_key()
+        if key != self._movement_ranges_key:
+            self._movement_ranges = {}
+            self._movement_ranges_key = key
+
+            entities = self._model.get_entities()
+            mechs = [index for index, mech in enumerate(entities)
+                     if mech.is_friendly() and mech.is_active()]
+
+            def find(model: BreachModel) -> list[list[tuple[int, int]]]:
+                return [
+                    model.get_valid_movement_positions(
+                        model.get_entities()[index]
+                    )
+                    for index in mechs
+                ]
+
+            def found(model: BreachModel, 
+                      ranges: list[list[tuple[int, int]]]) -> None:
+                if self._movement_ranges_key == key:
+                    self._movement_ranges = {
+                        entities[index]: positions 
+                        for index, positions in zip(mechs, ranges)
+                    }
+                    self.request_redraw()
+                    self._show_preview()
+
+            self._run_in_background(find, found)
+        return self._movement_ranges.get(entity)
+
+    def _handle_hover(self, position: Optional[tuple[int, int]]) -> None:
+        """
+        Previews the movement range of the mech under the pointer, if any.
+
+        Args:
+            position (Optional[tuple[int, int]]): hovered position, or None if
+                                                  the pointer left the board
+        """
+        self._hovered = position
+        self._show_preview()
+
+    def _show_preview(self) -> None:
+        """
+        Outlines the movement range of the hovered mech, or clears the 
+        preview if no active mech is hovered
+        """
+        positions = None
+        entity = self._model.entity_positions().get(self._hovered)
+        if entity is not None and entity.is_friendly() \
+                and entity.is_active() and not self._turn_in_flight:
+            positions = self._get_movement_range(entity)
+        self._view.preview(positions)
 
     def set_focussed_entity(self, entity: Optional[Entity]) -> None:
         """
@@ -1140,83 +3093,215 @@ class IntoTheBreach:
             position (tuple[int, int]): Position to move focussed entity to.
         """
         if self._active_entity:
-            self._model.attempt_move(self._active_entity, position)
+            # Reuse the movement range found for highlighting, if there is one
+            positions = None
+            if self._movement_ranges_key == self._get_state_key():
+                positions = self._movement_ranges.get(self._active_entity)
+            with self._model_lock:
+                self._model.attempt_move(self._active_entity, position, 
+                                         positions)
             self.set_focussed_entity(None)
-            self.redraw()
+            self.request_redraw()
 
-    def load_model(self, file_path: str) -> None:
+    def load_model(
+        self, 
+        file_path: str, 
+        level: Optional[Union[int, str]] = None,
+    ) -> None:
         """
         Replaces current game state with the game state provided in the 
         specified file.
 
         Args:
             file_path (str): file from which to load new game state.
+            level (Optional[Union[int, str]]): Position or name of the level
+                                               to load if file_path is a 
+                                               level pack. Optional: 
+                                               Defaults to None.
         """
-        # NOTE: this is just one solution. There are many ways to parse this
         try:
-            with open(file_path) as f:
-                # Read in board state
-                text_board = []
-                row = f.readline().rstrip() # NOTE assuming at least one row
-                while row:  # Blank lines between board and entities
-                    text_row = []
-                    for tile in row:
-                        text_row.append(tile)
-                    text_board.append(text_row)
-                    row = f.readline().rstrip()
-
-                # Read in entities (Ordered as they appear in file)
-                entity_text = f.read().splitlines() # remaining lines in file
-                entities = []
-                for entity_string in entity_text:
-                    entity_values = entity_string.split(",")
-                    entities.append(
-                        ENTITY_MAP[entity_values[0]](
-                            (int(entity_values[1]), int(entity_values[2])),
-                            *map(int, entity_values[3:]),
-                        )
-                    ) 
-
-            self._model = BreachModel(Board(text_board), entities)
+            if level is None and self._is_autosave_file(file_path):
+                self._model = load_autosave(file_path)
+            else:
+                self._model = load_level(file_path, level)
 
         except IOError as e:
             messagebox.showerror(IO_ERROR_TITLE, 
                                  IO_ERROR_MESSAGE + str(e))
+            return
+
+        if self._autosaver is not None:
+            board = self._model.get_board()
+            self._autosaver.new_game(board.get_dimensions(), 
+                                     board.get_tile_kinds)
+            self._autosaved_state = None
+
+        # Discard results computed for the previous game
+        self._generation += 1
+        self._movement_ranges_key = None
+        if self._turn_in_flight:
+            self._set_busy(False)
 
     def _save_game(self) -> None:
         """
         Saves the current game state to a user specified file if it is valid to 
         do so
         """
+        if self._turn_in_flight:
+            return
+
         # Check if in valid state to save
         if self._model.ready_to_save():
             file_path = filedialog.asksaveasfilename()
             if file_path:
-                with open(file_path, 'w') as f:
-                    f.write(str(self._model))
+                try:
+                    save_level(self._model, file_path)
+                except IOError as e:
+                    messagebox.showerror(IO_ERROR_TITLE, 
+                                         IO_ERROR_MESSAGE + str(e))
         else:
             messagebox.showerror(INVALID_SAVE_TITLE, INVALID_SAVE_MESSAGE)
 
+    def _autosave(self) -> None:
+        """
+        Hands the game state to the autosaver if it has changed since the 
+        last autosave and could be saved by the user. Only building health 
+        and entities are captured here, and the files are written on the
+        autosaver's thread. If an autosave fails, the error is reported once
+        and autosaving stops.
+        """
+        self._autosave_job = None
+        error = self._autosaver.pop_error()
+        if error is not None:
+            messagebox.showerror(IO_ERROR_TITLE, 
+                                 AUTOSAVE_ERROR_MESSAGE + str(error))
+            return
+        self._autosave_job = self._root.after(AUTOSAVE_INTERVAL, 
+                                              self._autosave)
+
+        state = self._get_state_key()
+        if self._model.ready_to_save() and state != self._autosaved_state:
+            self._autosaved_state = state
+            self._autosaver.submit(
+                self._model.get_board().get_building_health(),
+                entity_records(self._model.get_entities()),
+            )
+
+    def _is_autosave_file(self, file_path: str) -> bool:
+        """
+        (bool) Returns true if file_path is this game's autosave file
+        """
+        return (self._autosave_file is not None and os.path.abspath(file_path) 
+                == os.path.abspath(self._autosave_file))
+
+    def _quit(self) -> None:
+        """
+        Stops scheduled work and the autosaver, then closes the window
+        """
+        self._closed = True
+        self._view.stop_animation()
+        for job in (self._paint_job, self._poll_job, self._autosave_job):
+            if job is not None:
+                self._root.after_cancel(job)
+        if self._autosaver is not None:
+            self._autosaver.close()
+        self._root.destroy()
+
     def _load_game(self) -> None:
         """
         Loads a new game from a user defined file.
         """
+        self._view.stop_animation()
         self.set_focussed_entity(None)
         file_path = filedialog.askopenfilename()
         if file_path:
-            self._game_file = file_path
-            self.load_model(file_path)
+            level = None
+            if file_path.endswith(PACK_EXTENSION):
+                level = self._choose_packed_level(file_path)
+            if level is not None or not file_path.endswith(PACK_EXTENSION):
+                self._game_file = file_path
+                self._game_level = level
+                self.load_model(file_path, level)
 
-        self.redraw()
+        self.request_redraw()
+
+    def _choose_packed_level(self, file_path: str) -> Optional[Union[int, str]]:
+        """
+        Asks the user which level of a level pack to load.
+
+        Args:
+            file_path (str): The level pack
+
+        Returns:
+            Optional[Union[int, str]]: The position or name of the chosen 
+                                       level, or None if none was chosen
+        """
+        try:
+            with LevelPack(file_path) as pack:
+                count = len(pack)
+        except IOError as e:
+            messagebox.showerror(IO_ERROR_TITLE, IO_ERROR_MESSAGE + str(e))
+            return None
+
+        answer = simpledialog.askstring(
+            LOAD_TEXT, f"Level name, or number from 1 to {count}:"
+        )
+        if not answer or not answer.strip():
+            return None
+        answer = answer.strip()
+        return int(answer) - 1 if answer.isdigit() else answer
 
     def _end_turn(self) -> None:
         """
-        Advances the game to the next turn, and handles asking the user 
-        if they want to play again if they win or lose.
+        Starts advancing the game to the next turn. The turn is resolved on a
+        worker thread, and input is disabled until it is.
         """
+        if self._turn_in_flight:
+            return
+        self._view.stop_animation()
         self.set_focussed_entity(None)
-        self._model.end_turn()
+        self._set_busy(True)
+        self._show_preview()
+        self._run_in_background(self._advance, self._finish_turn, 
+                                lambda: self._set_busy(False))
+
+    @staticmethod
+    def _advance(model: BreachModel) -> list[Entity]:
+        """
+        Advances a copy of the game to the next turn. Runs on a worker thread.
+
+        Args:
+            model (BreachModel): A copy of the current game state
+
+        Returns:
+            list[Entity]: The copy's entities before the turn, for matching 
+                          them with those of the current game state
+        """
+        entities = list(model.get_entities())
+        model.end_turn()
+        return entities
+
+    def _finish_turn(self, model: BreachModel, 
+                     copied_entities: list[Entity]) -> None:
+        """
+        Shows the game state after a turn, and handles asking the user 
+        if they want to play again if they win or lose.
+
+        Args:
+            model (BreachModel): A copy of the game state, advanced to the 
+                                 next turn
+            copied_entities (list[Entity]): The copy's entities before the 
+                                            turn
+        """
+        # Entities keep their objects, so their labels are only moved
+        with self._model_lock:
+            self._model.update_from(model, copied_entities)
+        self._set_busy(False)
+
+        # Paint now, so that playback starts from the new state in the same 
+        # event and the labels never show at their destinations first
         self.redraw()
+        self._view.animate_movements(self._model.get_movements())
 
         # Check for termination
         result = None
@@ -1227,10 +3312,10 @@ class IntoTheBreach:
         if result:
             message = f"You {result}!"
             if messagebox.askyesno(message, message + " " + PLAY_AGAIN_TEXT):
-                self.load_model(self._game_file)
-                self.redraw()
+                self.load_model(self._game_file, self._game_level)
+                self.request_redraw()
             else:
-                self._root.destroy()
+                self._quit()
 
     def _handle_click(self, position: tuple[int, int]) -> None:
         """
@@ -1240,28 +3325,35 @@ class IntoTheBreach:
         Args:
             position (tuple[int, int]): position clicked by the user.
         """
+        if self._turn_in_flight:
+            return
+        self._view.stop_animation()
+
         entities = self._model.entity_positions()
         if position in entities:
             self._active_entity = entities[position]
-            self.redraw()
+            self.request_redraw()
         else:
             self.make_move(position)
 
-def play_game(root: tk.Tk, file_path: str) -> None:
+def play_game(root: tk.Tk, file_path: str, 
+              autosave_file: Optional[str] = None) -> None:
     """
     Plays the game.
 
     Args:
         file_path: The path to file containing level.
+        autosave_file: The path to autosave the game to, or None to not 
+                       autosave.
     """
-    app = IntoTheBreach(root, file_path)
+    app = IntoTheBreach(root, file_path, autosave_file)
     root.mainloop()
 
 
 def main() -> None:
     """The main function."""
     root = tk.Tk()
-    play_game(root, "levels/level1.txt")
+    play_game(root, "levels/level1.txt", AUTOSAVE_FILE)
 
 
 if __name__ == "__main__":
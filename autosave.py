@@ -0,0 +1,370 @@
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from typing import Callable, Optional
+
+from save_format import ENTITY_RECORD, decode_save, encode_save
+
+# Autosaves are kept in two files, each replaced atomically by renaming a
+# fully written temporary file over it:
+#
+#   snapshot  a full game state in the binary save format
+#   journal   the changes since that snapshot. All integers are
+#             little-endian.
+#
+#     header     magic, version, CRC-32 of the snapshot, #building changes,
+#                #entities, #entity changes
+#     buildings  one (index, health) record per changed building, where
+#                index counts buildings in row-major order
+#     entities   one (index, entity record) per changed entity
+#
+# A journal only applies to the snapshot whose checksum it holds, so a crash
+# between replacing the snapshot and the journal leaves a stale journal that
+# is ignored rather than a torn game state.
+JOURNAL_MAGIC = b"ITBJ"
+JOURNAL_VERSION = 1
+JOURNAL_HEADER = struct.Struct("<4sHIIII")
+BUILDING_CHANGE = struct.Struct("<IB")
+ENTITY_CHANGE = struct.Struct("<I" + ENTITY_RECORD.format.lstrip("<"))
+JOURNAL_SUFFIX = ".journal"
+
+# Number of autosaves written as journals between full snapshots
+SNAPSHOT_INTERVAL = 20
+
+Entities = list[tuple[str, int, int, int, int, int]]
+
+
+def journal_path(file_path: str) -> str:
+    """
+    (str) Returns the path of the journal that belongs to a snapshot
+    """
+    return file_path + JOURNAL_SUFFIX
+
+
+def write_atomically(file_path: str, data: bytes) -> None:
+    """
+    Writes data to a file through a temporary file that is renamed over it,
+    so the file either keeps its old contents or has all of the new ones.
+    Each write uses its own temporary file, so processes may write the same
+    file at once.
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(file_path)),
+        prefix=os.path.basename(file_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temporary_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def encode_journal(
+    snapshot_crc: int,
+    old_health: bytes,
+    old_entities: Entities,
+    building_health: bytes,
+    entities: Entities,
+) -> bytes:
+    """
+    Encodes the changes from a snapshot to a later game state of the same
+    board. Buildings are recorded if their health changed. Entities are
+    recorded if they changed, or all of them if some have died.
+
+    Args:
+        snapshot_crc (int): CRC-32 of the snapshot the changes apply to
+        old_health (bytes): Building health in the snapshot
+        old_entities (Entities): Entity records in the snapshot
+        building_health (bytes): Building health in the later state
+        entities (Entities): Entity records in the later state
+
+    Returns:
+        bytes: The journal
+    """
+    buildings = [
+        BUILDING_CHANGE.pack(index, health)
+        for index, (old, health) in enumerate(zip(old_health,
+                                                  building_health))
+        if old != health
+    ]
+
+    if len(entities) == len(old_entities):
+        changed = [index for index, (old, entity)
+                   in enumerate(zip(old_entities, entities)) if old != entity]
+    else:
+        changed = range(len(entities))
+    records = [
+        ENTITY_CHANGE.pack(index, entities[index][0].encode(),
+                           *entities[index][1:])
+        for index in changed
+    ]
+
+    return b"".join([
+        JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, snapshot_crc,
+                            len(buildings), len(entities), len(records)),
+        *buildings,
+        *records,
+    ])
+
+
+def apply_journal(
+    journal: bytes,
+    building_health: bytes,
+    entities: Entities,
+    source: str = "journal",
+) -> tuple[bytes, Entities]:
+    """
+    Applies a journal to the game state of its snapshot
+
+    Args:
+        journal (bytes): The journal
+        building_health (bytes): Building health in the snapshot
+        entities (Entities): Entity records in the snapshot
+        source (str): Name of where the journal came from, for error
+                      messages. Optional: Defaults to "journal".
+
+    Returns:
+        tuple[bytes, Entities]: The building health and entity records with
+                                the changes applied
+
+    Raises:
+        IOError: If the journal is malformed
+    """
+    if len(journal) < JOURNAL_HEADER.size:
+        raise IOError(f"{source} is too short to be a journal")
+    magic, version, _, buildings, count, changes = \
+        JOURNAL_HEADER.unpack_from(journal)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+        raise IOError(f"{source} is not a supported journal")
+    if len(journal) != JOURNAL_HEADER.size + BUILDING_CHANGE.size * buildings \
+            + ENTITY_CHANGE.size * changes:
+        raise IOError(f"{source} is truncated")
+
+    health = bytearray(building_health)
+    offset = JOURNAL_HEADER.size
+    for index, value in BUILDING_CHANGE.iter_unpack(
+            journal[offset:offset + BUILDING_CHANGE.size * buildings]):
+        if index >= len(health):
+            raise IOError(f"{source} changes a building that does not exist")
+        health[index] = value
+    offset += BUILDING_CHANGE.size * buildings
+
+    entities = list(entities[:count])
+    for index, symbol, *values in ENTITY_CHANGE.iter_unpack(journal[offset:]):
+        if index > len(entities) or index >= count:
+            raise IOError(f"{source} changes an entity that does not exist")
+        try:
+            record = (symbol.decode("ascii"), *values)
+        except UnicodeDecodeError:
+            raise IOError(f"{source} contains an invalid entity symbol") \
+                from None
+        if index == len(entities):
+            entities.append(record)
+        else:
+            entities[index] = record
+    if len(entities) != count:
+        raise IOError(f"{source} is missing entities")
+
+    return bytes(health), entities
+
+
+def read_autosave(file_path: str) -> tuple[
+    tuple[int, int], bytes, bytes, Entities
+]:
+    """
+    Reads an autosave, applying its journal if one was written for its
+    current snapshot. Only call this for autosave files, as any journal 
+    next to another save would be applied to it too.
+
+    Args:
+        file_path (str): The snapshot written by an Autosaver
+
+    Returns:
+        tuple: The same as save_format.read_save
+
+    Raises:
+        IOError: If either file cannot be read or is malformed
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    dimensions, tile_kinds, building_health, entities = \
+        decode_save(data, file_path)
+
+    try:
+        with open(journal_path(file_path), "rb") as f:
+            journal = f.read()
+    except FileNotFoundError:
+        journal = None
+
+    # Journals left over from an earlier snapshot are ignored
+    if journal is not None and len(journal) >= JOURNAL_HEADER.size \
+            and JOURNAL_HEADER.unpack_from(journal)[2] == zlib.crc32(data):
+        building_health, entities = apply_journal(
+            journal, building_health, entities, journal_path(file_path)
+        )
+    return dimensions, tile_kinds, building_health, entities
+
+
+class Autosaver:
+    """
+    Writes game states to an autosave file on a worker thread. Submitting a
+    state only stores it, so the caller never waits for the disk. States
+    submitted faster than they can be written are merged, and only the
+    latest is saved.
+
+    A full snapshot is written for each new game and every
+    SNAPSHOT_INTERVAL autosaves. In between, only a journal of the changes
+    since the snapshot is written.
+    """
+    def __init__(
+        self,
+        file_path: str,
+        snapshot_interval: int = SNAPSHOT_INTERVAL,
+    ) -> None:
+        """
+        Starts the worker thread
+
+        Args:
+            file_path (str): file to write snapshots to. Journals are
+                             written next to it, and its directory is 
+                             created if missing.
+            snapshot_interval (int): Number of journals written between
+                                     snapshots. Optional: Defaults to
+                                     SNAPSHOT_INTERVAL.
+        """
+        self._file_path = file_path
+        self._snapshot_interval = snapshot_interval
+
+        # Shared with the worker, guarded by _condition
+        self._condition = threading.Condition()
+        self._game = None
+        self._pending = None
+        self._closed = False
+        self._error = None
+
+        # Only used by the worker
+        self._saved_game = None
+        self._tile_kinds = None
+        self._snapshot = None  # (CRC-32, building health, entities)
+        self._journals = 0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def new_game(
+        self,
+        dimensions: tuple[int, int],
+        tile_kinds: Callable[[], bytes],
+    ) -> None:
+        """
+        Starts a new game, so that its first autosave is a full snapshot
+
+        Args:
+            dimensions (tuple[int, int]): (#rows, #columns) of the board
+            tile_kinds (Callable[[], bytes]): Returns the tile kinds of the
+                                              board. Only called on the
+                                              worker thread, when a
+                                              snapshot is written.
+        """
+        with self._condition:
+            self._game = (dimensions, tile_kinds)
+
+    def submit(self, building_health: bytes, entities: Entities) -> None:
+        """
+        Queues a game state of the current game to be saved
+
+        Args:
+            building_health (bytes): health of each building, in row-major
+                                     order
+            entities (Entities): (symbol, row, column, health, speed,
+                                 strength) of each entity
+        """
+        with self._condition:
+            if self._game is None:
+                raise ValueError("new_game must be called before submit")
+            self._pending = (self._game, building_health, entities)
+            self._condition.notify()
+
+    def pop_error(self) -> Optional[IOError]:
+        """
+        (Optional[IOError]) Returns the error of the last failed autosave,
+        if there was one since the last call
+        """
+        with self._condition:
+            error, self._error = self._error, None
+        return error
+
+    def close(self) -> None:
+        """
+        Writes any pending game state and stops the worker thread
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """
+        Writes submitted game states until closed
+        """
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                pending, self._pending = self._pending, None
+
+            try:
+                self._write(*pending)
+            except IOError as error:
+                with self._condition:
+                    self._error = error
+
+    def _write(
+        self,
+        game: tuple[tuple[int, int], Callable[[], bytes]],
+        building_health: bytes,
+        entities: Entities,
+    ) -> None:
+        """
+        Writes a snapshot or journal of a game state
+        """
+        dimensions, tile_kinds = game
+        if game is not self._saved_game:
+            self._saved_game = None
+            self._tile_kinds = tile_kinds()
+            self._snapshot = None
+
+        if self._snapshot is None or self._journals >= self._snapshot_interval:
+            os.makedirs(os.path.dirname(os.path.abspath(self._file_path)), 
+                        exist_ok=True)
+            data = encode_save(dimensions, self._tile_kinds,
+                               building_health, entities)
+            write_atomically(self._file_path, data)
+            self._snapshot = (zlib.crc32(data), building_health, entities)
+            self._saved_game = game
+            self._journals = 0
+            try:
+                os.remove(journal_path(self._file_path))
+            except FileNotFoundError:
+                pass
+            return
+
+        write_atomically(journal_path(self._file_path),
+                         encode_journal(*self._snapshot, building_health, 
+                                        entities))
+        self._journals += 1
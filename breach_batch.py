@@ -0,0 +1,404 @@
+import numpy as np
+
+from a2_support import *
+from a2_solution import BreachModel, Board, ENTITY_MAP
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """
+    (np.ndarray) Returns the cells orthogonally adjacent to any set cell of
+    a stack of (games, rows, columns) boolean masks
+    """
+    grown = np.zeros_like(mask)
+    grown[:, 1:, :] |= mask[:, :-1, :]
+    grown[:, :-1, :] |= mask[:, 1:, :]
+    grown[:, :, 1:] |= mask[:, :, :-1]
+    grown[:, :, :-1] |= mask[:, :, 1:]
+    return grown
+
+
+class BatchBreachModel:
+    """
+    Simulates many copies of one game of Into The Breach in lockstep. The
+    state of every game is stored in NumPy arrays indexed by game, so each
+    rule of BreachModel.end_turn is applied to all games with a handful of
+    array operations instead of one Python object graph per game.
+
+    Entities are identified by their slot, which is their index in the
+    entity list of the model the batch was created from. Levels are assumed
+    to be surrounded by blocking tiles, as all shipped levels are.
+    """
+    def __init__(self, model: BreachModel, n: int) -> None:
+        """
+        Creates n identical copies of the given game state
+
+        Args:
+            model (BreachModel): Game state to copy into every game
+            n (int): Number of games to simulate
+        """
+        board = model.get_board()
+        entities = model.get_entities()
+        self._n = n
+        self._height, self._width = board.get_dimensions()
+
+        # Static terrain
+        self._text_board = [list(row) for row in str(board).split("\n")]
+        self._mountains = np.array(
+            [[symbol == MOUNTAIN_SYMBOL for symbol in row]
+             for row in self._text_board],
+            dtype=bool
+        )
+        buildings = board.get_buildings()
+        self._building_positions = list(buildings)
+        self._building_index = np.full(
+            (self._height, self._width), -1, dtype=np.int64
+        )
+        for index, (row, col) in enumerate(self._building_positions):
+            self._building_index[row, col] = index
+        self._building_cells = self._building_index >= 0
+
+        # Static entity properties
+        for entity in entities:
+            if entity.get_symbol() not in ENTITY_MAP:
+                raise ValueError(f"Unsupported entity: {entity!r}")
+        self._symbols = [entity.get_symbol() for entity in entities]
+        self._records = [str(entity).split(",") for entity in entities]
+        self._friendly = np.array(
+            [entity.is_friendly() for entity in entities], dtype=bool
+        )
+        self._speed = [entity.get_speed() for entity in entities]
+        self._strength = [entity.get_strength() for entity in entities]
+        self._offsets = []
+        for entity in entities:
+            row, col = entity.get_position()
+            self._offsets.append([
+                (target[0] - row, target[1] - col)
+                for target in entity.get_targets()
+            ])
+
+        # Per game state
+        self._positions = np.tile(
+            np.array([entity.get_position() for entity in entities],
+                     dtype=np.int64).reshape(-1, 2),
+            (n, 1, 1)
+        )
+        self._health = np.tile(
+            np.array([entity.get_health() for entity in entities],
+                     dtype=np.int64),
+            (n, 1)
+        )
+        self._present = np.ones((n, len(entities)), dtype=bool)
+        self._active = np.tile(
+            np.array([entity.is_friendly() and entity.is_active()
+                      for entity in entities], dtype=bool),
+            (n, 1)
+        )
+        self._objectives = self._positions.copy()
+        for slot, entity in enumerate(entities):
+            if not entity.is_friendly():
+                self._objectives[:, slot] = entity.get_objective()
+        self._building_health = np.tile(
+            np.array([int(str(building)) for building in buildings.values()],
+                     dtype=np.int64),
+            (n, 1)
+        )
+
+    def __len__(self) -> int:
+        return self._n
+
+    def get_model(self, game: int) -> BreachModel:
+        """
+        Builds a BreachModel holding the current state of one game
+
+        Args:
+            game (int): Index of the game to build
+
+        Returns:
+            BreachModel: Independent model equal to the given game's state
+        """
+        text_board = [list(row) for row in self._text_board]
+        for index, (row, col) in enumerate(self._building_positions):
+            text_board[row][col] = str(self._building_health[game, index])
+
+        entities = []
+        for slot, record in enumerate(self._records):
+            if not self._present[game, slot]:
+                continue
+            entity = ENTITY_MAP[record[0]](
+                tuple(int(value) for value in self._positions[game, slot]),
+                int(self._health[game, slot]),
+                *map(int, record[4:]),
+            )
+            if entity.is_friendly():
+                if not self._active[game, slot]:
+                    entity.disable()
+            else:
+                entity.set_objective(tuple(
+                    int(value) for value in self._objectives[game, slot]
+                ))
+            entities.append(entity)
+
+        return BreachModel(Board(text_board), entities)
+
+    def _has_friendly(self) -> np.ndarray:
+        return (self._present & self._friendly).any(axis=1)
+
+    def _has_enemies(self) -> np.ndarray:
+        return (self._present & ~self._friendly).any(axis=1)
+
+    def _has_buildings(self) -> np.ndarray:
+        return (self._building_health > 0).any(axis=1)
+
+    def has_won(self) -> np.ndarray:
+        """
+        (np.ndarray) Returns a boolean array that is True for each game the
+        player has won
+        """
+        return (
+            self._has_friendly()
+            & self._has_buildings()
+            & ~self._has_enemies()
+        )
+
+    def has_lost(self) -> np.ndarray:
+        """
+        (np.ndarray) Returns a boolean array that is True for each game the
+        player has lost
+        """
+        return ~(self._has_friendly() & self._has_buildings())
+
+    def _occupancy(self) -> np.ndarray:
+        """
+        (np.ndarray) Returns a (games, rows, columns) mask of cells that
+        currently hold an entity
+        """
+        occupied = np.zeros((self._n, self._height, self._width), dtype=bool)
+        games, slots = np.nonzero(self._present)
+        occupied[games,
+                 self._positions[games, slots, 0],
+                 self._positions[games, slots, 1]] = True
+        return occupied
+
+    def _free_cells(self, occupied: np.ndarray) -> np.ndarray:
+        """
+        (np.ndarray) Returns a (games, rows, columns) mask of cells that paths
+        may pass through, given the current occupancy
+        """
+        standing = np.zeros((self._n, self._height, self._width), dtype=bool)
+        standing[:, self._building_cells] = (
+            self._building_health[:, self._building_index[self._building_cells]]
+            > 0
+        )
+        return ~(self._mountains[None] | standing | occupied)
+
+    def _reachable(self, slot: int, games: np.ndarray,
+                   free: np.ndarray) -> np.ndarray:
+        """
+        (np.ndarray) Returns the (games, rows, columns) mask of positions an
+        entity could move to in each of the given games, equivalent to
+        BreachModel.get_valid_movement_positions.
+        """
+        start = np.zeros_like(free)
+        start[games,
+              self._positions[games, slot, 0],
+              self._positions[games, slot, 1]] = True
+        visited = start.copy()
+        frontier = start
+        for _ in range(self._speed[slot]):
+            frontier = _dilate(frontier) & free & ~visited
+            if not frontier.any():
+                break
+            visited |= frontier
+        return visited & ~start
+
+    def valid_movement_mask(self, slot: int) -> np.ndarray:
+        """
+        Returns the positions the entity in the given slot could move to in
+        every game.
+
+        Args:
+            slot (int): Slot of the entity
+
+        Returns:
+            np.ndarray: (games, rows, columns) boolean mask, empty for games
+                        in which the entity has been destroyed
+        """
+        games = np.nonzero(self._present[:, slot])[0]
+        return self._reachable(slot, games,
+                               self._free_cells(self._occupancy()))
+
+    def attempt_moves(self, slot: int, positions: np.ndarray) -> None:
+        """
+        Moves the mech in the given slot to the given position in every game
+        where it is alive, active and allowed to move there, then disables it.
+
+        Args:
+            slot (int): Slot of the mech to move
+            positions (np.ndarray): (games, 2) array of target positions
+        """
+        if not self._friendly[slot]:
+            return
+        positions = np.asarray(positions, dtype=np.int64)
+        reachable = self.valid_movement_mask(slot)
+        in_bounds = (
+            (0 <= positions[:, 0]) & (positions[:, 0] < self._height)
+            & (0 <= positions[:, 1]) & (positions[:, 1] < self._width)
+        )
+        rows = np.clip(positions[:, 0], 0, self._height - 1)
+        cols = np.clip(positions[:, 1], 0, self._width - 1)
+        moving = (
+            self._active[:, slot]
+            & in_bounds
+            & reachable[np.arange(self._n), rows, cols]
+        )
+        self._positions[moving, slot] = positions[moving]
+        self._active[moving, slot] = False
+
+    def _make_attacks(self, slot: int) -> None:
+        """
+        Makes the entity in the given slot attack in every game where it is
+        alive, as in BreachModel.make_attack
+
+        Args:
+            slot (int): Slot of the attacking entity
+        """
+        attacking = self._present[:, slot] & (self._health[:, slot] > 0)
+        if not attacking.any():
+            return
+        strength = self._strength[slot]
+        # Heal mechs only affect friendly entities
+        if self._symbols[slot] == HEAL_SYMBOL:
+            targetable = self._friendly
+        else:
+            targetable = np.ones_like(self._friendly)
+
+        for d_row, d_col in self._offsets[slot]:
+            rows = self._positions[:, slot, 0] + d_row
+            cols = self._positions[:, slot, 1] + d_col
+            hit = (
+                attacking
+                & (0 <= rows) & (rows < self._height)
+                & (0 <= cols) & (cols < self._width)
+            )
+            rows = np.clip(rows, 0, self._height - 1)
+            cols = np.clip(cols, 0, self._width - 1)
+
+            # Damage standing buildings
+            buildings = self._building_index[rows, cols]
+            games = np.nonzero(hit & (buildings >= 0))[0]
+            if len(games):
+                indices = buildings[games]
+                health = self._building_health[games, indices]
+                self._building_health[games, indices] = np.where(
+                    health > 0,
+                    np.clip(health - strength, 0, MAX_BUILDING_HEALTH),
+                    health,
+                )
+
+            # Damage living entities
+            targets = (
+                hit[:, None]
+                & self._present
+                & (self._health > 0)
+                & targetable[None]
+                & (self._positions[:, :, 0] == rows[:, None])
+                & (self._positions[:, :, 1] == cols[:, None])
+            )
+            if targets.any():
+                self._health = np.where(
+                    targets, np.maximum(self._health - strength, 0),
+                    self._health
+                )
+
+    def _assign_objectives(self) -> None:
+        """
+        Updates the objectives of every enemy in every game, as in
+        BreachModel.assign_objectives
+        """
+        # Scorpions target the first friendly with the greatest health
+        friendly_health = np.where(
+            self._present & self._friendly, self._health, 0
+        )
+        strongest = friendly_health.argmax(axis=1)
+        found = friendly_health.max(axis=1) > 0
+        strongest_position = self._positions[np.arange(self._n), strongest]
+
+        # Fireflies target the last building with the lowest health, where
+        # destroyed buildings are only chosen if the first building is
+        min_health = np.full(self._n, -1, dtype=np.int64)
+        weakest = np.full(self._n, -1, dtype=np.int64)
+        for index in range(len(self._building_positions)):
+            health = self._building_health[:, index]
+            chosen = (
+                (min_health < 0)
+                | ((0 < health) & (health <= min_health))
+                | (health == min_health)
+            )
+            min_health = np.where(chosen, health, min_health)
+            weakest = np.where(chosen, index, weakest)
+
+        for slot, symbol in enumerate(self._symbols):
+            if symbol == SCORPION_SYMBOL:
+                self._objectives[found, slot] = strongest_position[found]
+            elif symbol == FIREFLY_SYMBOL and self._building_positions:
+                self._objectives[:, slot] = np.array(
+                    self._building_positions
+                )[weakest]
+
+    def _move_enemies(self) -> None:
+        """
+        Moves every enemy in every game, in priority order, as in
+        BreachModel.move_enemies
+        """
+        occupied = self._occupancy()
+        flat_index = np.arange(self._height * self._width)
+        for slot, friendly in enumerate(self._friendly):
+            games = np.nonzero(self._present[:, slot] & ~friendly)[0]
+            if not len(games):
+                continue
+            free = self._free_cells(occupied)
+            candidates = self._reachable(slot, games, free)
+
+            # Search outwards from each objective until a layer contains a
+            # candidate, then take the last candidate in that layer
+            layer = np.zeros_like(free)
+            layer[games,
+                  self._objectives[games, slot, 0],
+                  self._objectives[games, slot, 1]] = True
+            visited = layer.copy()
+            target = np.full(self._n, -1, dtype=np.int64)
+            pending = np.zeros(self._n, dtype=bool)
+            pending[games] = True
+            while pending.any() and layer.any():
+                hits = (layer & candidates).reshape(self._n, -1)
+                found = pending & hits.any(axis=1)
+                target[found] = np.where(
+                    hits[found], flat_index, -1
+                ).max(axis=1)
+                pending &= ~found
+                layer[~pending] = False
+                layer = _dilate(layer) & free & ~visited
+                visited |= layer
+
+            moved = np.nonzero(target >= 0)[0]
+            if not len(moved):
+                continue
+            old = self._positions[moved, slot]
+            occupied[moved, old[:, 0], old[:, 1]] = False
+            self._positions[moved, slot, 0] = target[moved] // self._width
+            self._positions[moved, slot, 1] = target[moved] % self._width
+            new = self._positions[moved, slot]
+            occupied[moved, new[:, 0], new[:, 1]] = True
+
+    def end_turn(self) -> None:
+        """
+        Advances every game by one turn: all entities attack in priority
+        order, destroyed entities are removed, enemy objectives are reassigned
+        and enemies move in priority order, then all mechs are enabled.
+        """
+        for slot in range(len(self._symbols)):
+            self._make_attacks(slot)
+        self._present &= self._health > 0
+        self._assign_objectives()
+        self._move_enemies()
+        self._active = self._present & self._friendly
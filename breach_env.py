@@ -0,0 +1,388 @@
+import multiprocessing as mp
+import weakref
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from a2_support import *
+from a2_solution import BreachModel, load_level, OBSERVATION_PLANES
+
+OBSERVATION_DTYPE = np.int16
+
+END_TURN_ACTION = 0
+WIN_REWARD = 1.0
+LOSS_REWARD = -1.0
+MAX_TURNS = 100
+
+
+class BreachEnv:
+    """
+    Headless environment exposing a game of Into The Breach through a
+    reset/step interface, for training move selection policies.
+
+    Actions are integers. END_TURN_ACTION ends the turn, and every other
+    action moves one mech to one cell (see move_action). Observations are
+    (OBSERVATION_PLANES, rows, columns) arrays of feature planes.
+    """
+    def __init__(
+        self,
+        game_file: str,
+        max_turns: int = MAX_TURNS,
+        observation: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Creates an environment that plays the given level
+
+        Args:
+            game_file (str): file from which to load the initial game state
+            max_turns (int): Number of turns after which an episode is cut
+                             short. Optional: Defaults to MAX_TURNS.
+            observation (Optional[np.ndarray]): Buffer that observations are
+                                                written into. Optional:
+                                                Defaults to None, in which
+                                                case one is allocated.
+        """
+        self._max_turns = max_turns
+        # Episodes start from copies of the level's initial game state
+        self._initial = load_level(game_file)
+        self._model = self._initial
+        height, width = self._initial.get_board().get_dimensions()
+        if observation is None:
+            observation = np.zeros(
+                (OBSERVATION_PLANES, height, width), dtype=OBSERVATION_DTYPE
+            )
+        self._observation = observation
+        self._mechs = []
+        self._turn = 0
+        self.reset()
+
+    def get_model(self) -> BreachModel:
+        """
+        (BreachModel) Returns the game state of the current episode
+        """
+        return self._model
+
+    def get_observation(self) -> np.ndarray:
+        """
+        (np.ndarray) Returns the observation of the current game state. The
+        same buffer is overwritten by every call to reset and step.
+        """
+        return self._observation
+
+    def get_action_count(self) -> int:
+        """
+        (int) Returns the number of distinct actions
+        """
+        height, width = self._model.get_board().get_dimensions()
+        return 1 + len(self._mechs) * height * width
+
+    def move_action(self, mech: int, position: tuple[int, int]) -> int:
+        """
+        Returns the action that moves a mech to a position
+
+        Args:
+            mech (int): Index of the mech among the mechs present at the
+                        start of the episode, in priority order
+            position (tuple[int, int]): Position to move the mech to
+
+        Returns:
+            int: The corresponding action
+        """
+        height, width = self._model.get_board().get_dimensions()
+        row, col = position
+        return 1 + mech * height * width + row * width + col
+
+    def valid_actions(self) -> list[int]:
+        """
+        (list[int]) Returns the actions that currently change the game state,
+        including ending the turn
+        """
+        actions = [END_TURN_ACTION]
+        for index, mech in enumerate(self._mechs):
+            if mech.is_alive() and mech.is_active():
+                for position in self._model.get_valid_movement_positions(mech):
+                    actions.append(self.move_action(index, position))
+        return actions
+
+    def reset(self) -> np.ndarray:
+        """
+        Starts a new episode from the level's initial game state
+
+        Returns:
+            np.ndarray: Observation of the initial game state
+        """
+        self._model = self._initial.copy()
+        self._mechs = [
+            entity for entity in self._model.get_entities()
+            if entity.is_friendly()
+        ]
+        self._turn = 0
+        self._encode()
+        return self._observation
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        """
+        Applies an action to the game
+
+        Args:
+            action (int): END_TURN_ACTION, or an action from move_action.
+                          Invalid moves leave the game unchanged.
+
+        Returns:
+            tuple[np.ndarray, float, bool, dict]: The observation, reward,
+                whether the episode is over, and a dictionary of extra
+                information ("turn", "won", "lost" and "truncated")
+        """
+        reward = 0.0
+        done = False
+        truncated = False
+        if action == END_TURN_ACTION:
+            self._model.end_turn()
+            self._turn += 1
+            if self._model.has_lost():
+                reward = LOSS_REWARD
+                done = True
+            elif self._model.has_won():
+                reward = WIN_REWARD
+                done = True
+            elif self._turn >= self._max_turns:
+                done = truncated = True
+        else:
+            height, width = self._model.get_board().get_dimensions()
+            mech, cell = divmod(action - 1, height * width)
+            # Mechs stay in _mechs after dying, so that actions keep their
+            # meaning, but they can no longer move
+            if 0 <= mech < len(self._mechs) and self._mechs[mech].is_alive():
+                self._model.attempt_move(self._mechs[mech],
+                                         divmod(cell, width))
+
+        self._encode()
+        return self._observation, reward, done, {
+            "turn": self._turn,
+            "won": done and reward == WIN_REWARD,
+            "lost": done and reward == LOSS_REWARD,
+            "truncated": truncated,
+        }
+
+    def _encode(self) -> None:
+        """
+        Writes the current game state into the observation buffer
+        """
+        self._model.encode(self._observation)
+
+
+def _attach(name: str, shape: tuple, dtype) -> tuple:
+    """
+    Attaches to a shared memory block created by BreachVectorEnv
+
+    Returns:
+        tuple[SharedMemory, np.ndarray]: The block, and an array viewing it
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _shutdown(connections: list, processes: list, blocks: list) -> None:
+    """
+    Stops the workers of a BreachVectorEnv and releases its shared memory.
+    Takes the environment's lists rather than the environment, so that it
+    can also run as the environment's finalizer.
+    """
+    for connection in connections:
+        try:
+            connection.send("close")
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join()
+    for connection in connections:
+        connection.close()
+    connections.clear()
+    processes.clear()
+
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass  # arrays viewing the block are still in use elsewhere
+        block.unlink()
+    blocks.clear()
+
+
+def _worker(connection, game_file: str, max_turns: int,
+            start: int, stop: int, buffers: dict) -> None:
+    """
+    Runs environments start to stop of a BreachVectorEnv in a worker process.
+    Actions are read from and results written to shared memory. Only short
+    commands and acknowledgements travel through the connection.
+    """
+    blocks = []
+    arrays = {}
+    for key, (name, shape, dtype) in buffers.items():
+        block, arrays[key] = _attach(name, shape, dtype)
+        blocks.append(block)
+
+    envs = [
+        BreachEnv(game_file, max_turns, arrays["observations"][index])
+        for index in range(start, stop)
+    ]
+    try:
+        while True:
+            command = connection.recv()
+            if command == "step":
+                for index, env in enumerate(envs, start):
+                    _, reward, done, _ = env.step(
+                        int(arrays["actions"][index])
+                    )
+                    if done:
+                        env.reset()
+                    arrays["rewards"][index] = reward
+                    arrays["dones"][index] = done
+            elif command == "reset":
+                for env in envs:
+                    env.reset()
+            else:
+                break
+            connection.send(command)
+    finally:
+        del arrays, envs
+        for block in blocks:
+            block.close()
+
+
+class BreachVectorEnv:
+    """
+    Steps many BreachEnv instances of one level in worker processes.
+    Observations, actions, rewards and done flags live in shared memory, so
+    a step only sends a short command to each worker instead of pickled
+    arrays. Environments are reset automatically when an episode ends.
+
+    Use it as a context manager, or call close, to stop the workers. If it
+    is garbage collected first, the shared memory is still released.
+    """
+    def __init__(
+        self,
+        game_file: str,
+        num_envs: int,
+        num_workers: Optional[int] = None,
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        """
+        Starts the worker processes
+
+        Args:
+            game_file (str): file from which to load the initial game state
+            num_envs (int): Number of environments
+            num_workers (Optional[int]): Number of worker processes. Optional:
+                                         Defaults to None, meaning one per CPU.
+            max_turns (int): Number of turns after which an episode is cut
+                             short. Optional: Defaults to MAX_TURNS.
+        """
+        probe = BreachEnv(game_file, max_turns)
+        self._single_env = probe
+        self._num_envs = num_envs
+        num_workers = min(num_envs, num_workers or mp.cpu_count())
+
+        shapes = {
+            "observations": (
+                (num_envs,) + probe.get_observation().shape,
+                OBSERVATION_DTYPE
+            ),
+            "actions": ((num_envs,), np.int64),
+            "rewards": ((num_envs,), np.float64),
+            "dones": ((num_envs,), np.bool_),
+        }
+        self._blocks = []
+        self._arrays = {}
+        buffers = {}
+        for key, (shape, dtype) in shapes.items():
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            self._blocks.append(block)
+            self._arrays[key] = np.ndarray(shape, dtype=dtype,
+                                           buffer=block.buf)
+            buffers[key] = (block.name, shape, dtype)
+
+        self._connections = []
+        self._processes = []
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = mp.Pipe()
+            process = mp.Process(
+                target=_worker,
+                args=(child, game_file, max_turns, int(start), int(stop),
+                      buffers),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._connections, self._processes, self._blocks
+        )
+
+    def __len__(self) -> int:
+        return self._num_envs
+
+    def __enter__(self) -> "BreachVectorEnv":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_action_count(self) -> int:
+        """
+        (int) Returns the number of distinct actions in each environment
+        """
+        return self._single_env.get_action_count()
+
+    def _broadcast(self, command: str) -> None:
+        """
+        Sends a command to every worker and waits for all of them to finish
+        """
+        for connection in self._connections:
+            connection.send(command)
+        for connection in self._connections:
+            connection.recv()
+
+    def reset(self) -> np.ndarray:
+        """
+        Resets every environment
+
+        Returns:
+            np.ndarray: (num_envs, OBSERVATION_PLANES, rows, columns)
+                        observations. The array is shared with the workers
+                        and overwritten by every call to reset and step.
+        """
+        self._broadcast("reset")
+        return self._arrays["observations"]
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Applies one action to each environment
+
+        Args:
+            actions (Sequence[int]): One action per environment
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Observations, rewards
+                and done flags. Observations of finished episodes are those
+                of the environment after it was reset.
+        """
+        self._arrays["actions"][:] = actions
+        self._broadcast("step")
+        return (
+            self._arrays["observations"],
+            self._arrays["rewards"],
+            self._arrays["dones"]
+        )
+
+    def close(self) -> None:
+        """
+        Stops the workers and releases the shared memory
+        """
+        self._arrays = {}
+        self._finalizer()
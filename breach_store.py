@@ -0,0 +1,371 @@
+import sqlite3
+import time
+from typing import Iterable, Optional
+
+from a2_solution import BreachModel, level_from_bytes, level_to_bytes
+from replay import Replay
+
+# Seconds a connection waits for another writer to finish before failing
+STORE_TIMEOUT = 30.0
+
+# Outcomes of simulated games, as reported by BreachEnv.step
+WON = "won"
+LOST = "lost"
+TRUNCATED = "truncated"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS levels (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    path TEXT,
+    rows INTEGER NOT NULL,
+    columns INTEGER NOT NULL,
+    mechs INTEGER NOT NULL,
+    enemies INTEGER NOT NULL,
+    buildings INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    level_id INTEGER NOT NULL REFERENCES levels(id),
+    turn INTEGER NOT NULL,
+    created REAL NOT NULL,
+    state BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS replays (
+    id INTEGER PRIMARY KEY,
+    level_id INTEGER NOT NULL REFERENCES levels(id),
+    policy TEXT NOT NULL,
+    outcome TEXT,
+    turns INTEGER NOT NULL,
+    created REAL NOT NULL,
+    log BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY,
+    level_id INTEGER NOT NULL REFERENCES levels(id),
+    policy TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    reward REAL NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_level ON saves (level_id, turn);
+CREATE INDEX IF NOT EXISTS replays_level ON replays (level_id, policy);
+CREATE INDEX IF NOT EXISTS replays_outcome ON replays (outcome);
+CREATE INDEX IF NOT EXISTS outcomes_level
+    ON outcomes (level_id, policy, outcome);
+CREATE INDEX IF NOT EXISTS outcomes_policy ON outcomes (policy, outcome);
+CREATE INDEX IF NOT EXISTS outcomes_outcome ON outcomes (outcome);
+"""
+
+
+class BreachStore:
+    """
+    A local SQLite database of levels, saved game states, replay logs and
+    the outcomes of simulated games. Game states are stored in the binary
+    save format and replays as replay logs.
+
+    The database uses write-ahead logging, so readers never wait for
+    writers, and each writer only holds the lock for its own short
+    transaction. Simulator workers should each open their own store, and
+    report many outcomes at once with add_outcomes.
+    """
+    def __init__(self, db_path: str) -> None:
+        """
+        Opens a store, creating the database if it does not exist
+
+        Args:
+            db_path (str): file containing the database
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self._connection = sqlite3.connect(db_path, timeout=STORE_TIMEOUT)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        self._level_ids = {}  # name -> id
+
+    def __enter__(self) -> "BreachStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database
+        """
+        self._connection.close()
+
+    def add_level(
+        self,
+        name: str,
+        model: BreachModel,
+        path: Optional[str] = None,
+    ) -> int:
+        """
+        Records a level's metadata, replacing any earlier record of it
+
+        Args:
+            name (str): Name identifying the level
+            model (BreachModel): Initial game state of the level
+            path (Optional[str]): file the level is loaded from. Optional:
+                                  Defaults to None.
+
+        Returns:
+            int: The level's id
+        """
+        rows, cols = model.get_board().get_dimensions()
+        entities = model.get_entities()
+        mechs = sum(1 for entity in entities if entity.is_friendly())
+        values = (path, rows, cols, mechs, len(entities) - mechs,
+                  len(model.get_board().get_buildings()))
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO levels "
+                "(name, path, rows, columns, mechs, enemies, buildings) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET path = excluded.path, "
+                "rows = excluded.rows, columns = excluded.columns, "
+                "mechs = excluded.mechs, enemies = excluded.enemies, "
+                "buildings = excluded.buildings",
+                (name, *values)
+            )
+        self._level_ids.pop(name, None)
+        return self._level_id(name)
+
+    def get_levels(self) -> list[tuple[str, Optional[str], int, int]]:
+        """
+        (list[tuple[str, Optional[str], int, int]]) Returns the name, path
+        and (#rows, #columns) of every level, ordered by name
+        """
+        return [
+            (name, path, rows, cols)
+            for name, path, rows, cols in self._connection.execute(
+                "SELECT name, path, rows, columns FROM levels ORDER BY name"
+            )
+        ]
+
+    def _level_id(self, name: str) -> int:
+        """
+        Returns the id of a level
+
+        Raises:
+            KeyError: If the level has not been added
+        """
+        if name not in self._level_ids:
+            row = self._connection.execute(
+                "SELECT id FROM levels WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"no level named {name!r}")
+            self._level_ids[name] = row[0]
+        return self._level_ids[name]
+
+    def save_state(self, level: str, model: BreachModel,
+                   turn: int = 0) -> int:
+        """
+        Stores a game state of a level
+
+        Args:
+            level (str): Name of the level
+            model (BreachModel): Game state at the start of a turn
+            turn (int): Number of turns played. Optional: Defaults to 0.
+
+        Returns:
+            int: The id of the saved state
+        """
+        level_id = self._level_id(level)
+        state = level_to_bytes(model)
+        with self._connection:
+            return self._connection.execute(
+                "INSERT INTO saves (level_id, turn, created, state) "
+                "VALUES (?, ?, ?, ?)",
+                (level_id, turn, time.time(), state)
+            ).lastrowid
+
+    def load_state(self, save_id: int) -> BreachModel:
+        """
+        Returns a new model of a saved game state
+
+        Raises:
+            KeyError: If there is no saved state with the id
+        """
+        row = self._connection.execute(
+            "SELECT state FROM saves WHERE id = ?", (save_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"no saved state {save_id}")
+        return level_from_bytes(row[0], f"saved state {save_id}")
+
+    def get_saves(self, level: str) -> list[tuple[int, int, float]]:
+        """
+        (list[tuple[int, int, float]]) Returns the id, turn and creation time
+        of each saved state of a level, latest turn first
+        """
+        return self._connection.execute(
+            "SELECT id, turn, created FROM saves WHERE level_id = ? "
+            "ORDER BY turn DESC, id DESC",
+            (self._level_id(level),)
+        ).fetchall()
+
+    def add_replay(
+        self,
+        level: str,
+        policy: str,
+        log_path: str,
+        outcome: Optional[str] = None,
+    ) -> int:
+        """
+        Stores a replay log written by replay.ReplayRecorder
+
+        Args:
+            level (str): Name of the level played
+            policy (str): Name of the policy that played
+            log_path (str): file containing the replay log
+            outcome (Optional[str]): WON, LOST or TRUNCATED, if the game
+                                     ended. Optional: Defaults to None.
+
+        Returns:
+            int: The id of the stored replay
+
+        Raises:
+            IOError: If the log cannot be read or is not a valid replay log
+        """
+        with open(log_path, "rb") as f:
+            log = f.read()
+        turns = Replay.from_bytes(log, log_path).get_turn_count()
+        level_id = self._level_id(level)
+        with self._connection:
+            return self._connection.execute(
+                "INSERT INTO replays "
+                "(level_id, policy, outcome, turns, created, log) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (level_id, policy, outcome, turns, time.time(), log)
+            ).lastrowid
+
+    def get_replay(self, replay_id: int) -> Replay:
+        """
+        Returns a stored replay, ready for seeking
+
+        Raises:
+            KeyError: If there is no replay with the id
+        """
+        row = self._connection.execute(
+            "SELECT log FROM replays WHERE id = ?", (replay_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"no replay {replay_id}")
+        return Replay.from_bytes(row[0], f"replay {replay_id}")
+
+    def find_replays(
+        self,
+        level: Optional[str] = None,
+        policy: Optional[str] = None,
+        outcome: Optional[str] = None,
+    ) -> list[tuple[int, str, str, Optional[str], int]]:
+        """
+        Returns the id, level, policy, outcome and number of turns of the
+        stored replays matching every given filter, newest first
+
+        Args:
+            level (Optional[str]): Name of the level. Optional: Defaults to
+                                   None, matching any level.
+            policy (Optional[str]): Name of the policy. Optional: Defaults
+                                    to None, matching any policy.
+            outcome (Optional[str]): Outcome of the game. Optional: Defaults
+                                     to None, matching any outcome.
+        """
+        where, parameters = self._filters(level, policy, outcome, "replays")
+        return self._connection.execute(
+            "SELECT replays.id, levels.name, policy, outcome, turns "
+            "FROM replays JOIN levels ON levels.id = replays.level_id"
+            + where + " ORDER BY replays.id DESC",
+            parameters
+        ).fetchall()
+
+    def add_outcome(self, level: str, policy: str, outcome: str,
+                    turns: int, reward: float = 0.0) -> None:
+        """
+        Records the outcome of one simulated game. See add_outcomes.
+        """
+        self.add_outcomes([(level, policy, outcome, turns, reward)])
+
+    def add_outcomes(
+        self,
+        outcomes: Iterable[tuple[str, str, str, int, float]],
+    ) -> None:
+        """
+        Records the outcomes of many simulated games in one transaction
+
+        Args:
+            outcomes (Iterable[tuple[str, str, str, int, float]]): The level
+                name, policy name, outcome (WON, LOST or TRUNCATED), number
+                of turns and total reward of each game
+        """
+        created = time.time()
+        rows = [
+            (self._level_id(level), policy, outcome, turns, reward, created)
+            for level, policy, outcome, turns, reward in outcomes
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO outcomes "
+                "(level_id, policy, outcome, turns, reward, created) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def outcome_counts(
+        self,
+        level: Optional[str] = None,
+        policy: Optional[str] = None,
+    ) -> dict[str, int]:
+        """
+        Returns how many recorded games ended with each outcome
+
+        Args:
+            level (Optional[str]): Only count games of this level. Optional:
+                                   Defaults to None, counting every level.
+            policy (Optional[str]): Only count games of this policy.
+                                    Optional: Defaults to None, counting
+                                    every policy.
+
+        Returns:
+            dict[str, int]: The number of games with each outcome
+        """
+        where, parameters = self._filters(level, policy, None, "outcomes")
+        return dict(self._connection.execute(
+            "SELECT outcome, COUNT(*) FROM outcomes" + where
+            + " GROUP BY outcome",
+            parameters
+        ))
+
+    def _filters(
+        self,
+        level: Optional[str],
+        policy: Optional[str],
+        outcome: Optional[str],
+        table: str,
+    ) -> tuple[str, list]:
+        """
+        (tuple[str, list]) Returns a WHERE clause matching the given
+        filters on a table, and its parameters
+        """
+        conditions = []
+        parameters = []
+        if level is not None:
+            conditions.append(f"{table}.level_id = ?")
+            parameters.append(self._level_id(level))
+        if policy is not None:
+            conditions.append(f"{table}.policy = ?")
+            parameters.append(policy)
+        if outcome is not None:
+            conditions.append(f"{table}.outcome = ?")
+            parameters.append(outcome)
+        if not conditions:
+            return "", parameters
+        return " WHERE " + " AND ".join(conditions), parameters
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
+
+from a2_support import *
+from autosave import write_atomically
+from level_pack import LEVEL_EXTENSIONS, natural_key
+from level_parser import BUILDING_SYMBOLS, LevelParser
+from save_format import BUILDING_KIND, MAGIC, decode_save
+
+# File in a levels directory that caches the catalog
+CATALOG_FILE = ".catalog.json"
+CATALOG_VERSION = 1
+
+MECH_SYMBOLS = (TANK_SYMBOL, HEAL_SYMBOL)
+
+
+class LevelInfo(NamedTuple):
+    """
+    Metadata of a level file
+    """
+    name: str  # file name, including the extension
+    rows: int
+    columns: int
+    mechs: int
+    enemies: int
+    buildings: int
+    building_health: int  # total health of all buildings
+    mtime_ns: int
+    size: int
+    digest: str  # SHA-256 of the file's contents
+
+
+def read_level_info(file_path: str,
+                    cached: Optional[LevelInfo] = None) -> LevelInfo:
+    """
+    Reads the metadata of a level without building its game state
+
+    Args:
+        file_path (str): A level in the text or binary format
+        cached (Optional[LevelInfo]): Earlier metadata of the file. If the
+                                      contents still have the same hash, it
+                                      is reused instead of parsing the
+                                      level. Optional: Defaults to None.
+
+    Returns:
+        LevelInfo: The level's metadata
+
+    Raises:
+        IOError: If the file cannot be read or is not a valid level
+    """
+    with open(file_path, "rb") as f:
+        status = os.fstat(f.fileno())
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached is not None and cached.digest == digest:
+        return cached._replace(mtime_ns=status.st_mtime_ns,
+                               size=status.st_size)
+
+    if data.startswith(MAGIC):
+        (rows, cols), tile_kinds, health, records = \
+            decode_save(data, file_path)
+        buildings = tile_kinds.count(BUILDING_KIND)
+        building_health = sum(health)
+        symbols = [record[0] for record in records]
+    else:
+        parser = LevelParser(data.decode().splitlines())
+        buildings = building_health = 0
+        for row in parser.rows():
+            for symbol in BUILDING_SYMBOLS:
+                count = row.count(symbol)
+                buildings += count
+                building_health += int(symbol) * count
+        rows, cols = parser.get_dimensions()
+        symbols = [entity[0] for entity in parser.entities()]
+
+    mechs = sum(1 for symbol in symbols if symbol in MECH_SYMBOLS)
+    return LevelInfo(
+        os.path.basename(file_path), rows, cols, mechs, len(symbols) - mechs,
+        buildings, building_health, status.st_mtime_ns, status.st_size,
+        digest,
+    )
+
+
+class LevelCatalog:
+    """
+    Metadata of every level in a directory, cached in CATALOG_FILE so that
+    later scans only read levels that have changed. Levels are read on a
+    pool of threads.
+    """
+    def __init__(self, directory: str,
+                 cache_path: Optional[str] = None) -> None:
+        """
+        Opens the catalog of a directory, loading its cache if there is one.
+        Call scan to bring it up to date.
+
+        Args:
+            directory (str): Directory containing level files
+            cache_path (Optional[str]): file caching the catalog. Optional:
+                                        Defaults to None, meaning
+                                        CATALOG_FILE in the directory.
+        """
+        self._directory = directory
+        self._cache_path = cache_path or os.path.join(directory, CATALOG_FILE)
+        self._levels = {}  # name -> LevelInfo
+        self._errors = {}  # name -> message, for files that are not levels
+
+        try:
+            with open(self._cache_path) as f:
+                cache = json.load(f)
+            if cache.get("version") == CATALOG_VERSION:
+                self._levels = {
+                    fields[0]: LevelInfo(*fields) for fields in cache["levels"]
+                }
+        except (IOError, ValueError, TypeError, KeyError):
+            pass  # the cache is rebuilt by the next scan
+
+    def scan(self, workers: Optional[int] = None) -> int:
+        """
+        Brings the catalog up to date with the directory. Levels whose
+        modification time and size are unchanged are not read again, and
+        levels that were rewritten with the same contents are not parsed.
+
+        Args:
+            workers (Optional[int]): Number of threads reading levels.
+                                     Optional: Defaults to None, meaning
+                                     ThreadPoolExecutor's default.
+
+        Returns:
+            int: The number of levels that were read
+
+        Raises:
+            IOError: If the directory cannot be listed
+        """
+        names = [name for name in os.listdir(self._directory)
+                 if name.endswith(LEVEL_EXTENSIONS)]
+        levels = {}
+        stale = []
+        for name in names:
+            cached = self._levels.get(name)
+            try:
+                status = os.stat(os.path.join(self._directory, name))
+            except FileNotFoundError:
+                continue
+            if cached is not None and cached.mtime_ns == status.st_mtime_ns \
+                    and cached.size == status.st_size:
+                levels[name] = cached
+            else:
+                stale.append(name)
+
+        self._errors = {}
+        if stale:
+            with ThreadPoolExecutor(workers) as pool:
+                futures = {
+                    name: pool.submit(read_level_info,
+                                      os.path.join(self._directory, name),
+                                      self._levels.get(name))
+                    for name in stale
+                }
+            for name, future in futures.items():
+                try:
+                    levels[name] = future.result()
+                except (IOError, ValueError) as e:
+                    self._errors[name] = str(e)
+
+        changed = levels != self._levels
+        self._levels = levels
+        if changed:
+            self._save()
+        return len(stale)
+
+    def _save(self) -> None:
+        """
+        Writes the catalog to its cache file. A catalog that cannot be
+        cached still works, so errors are ignored.
+        """
+        cache = {
+            "version": CATALOG_VERSION,
+            "levels": [list(info) for info in self.get_levels()],
+        }
+        try:
+            write_atomically(self._cache_path, json.dumps(cache).encode())
+        except IOError:
+            pass
+
+    def get_levels(self) -> list[LevelInfo]:
+        """
+        (list[LevelInfo]) Returns the metadata of every level, in natural
+        order of their names
+        """
+        return sorted(self._levels.values(),
+                      key=lambda info: natural_key(info.name))
+
+    def get_path(self, info: LevelInfo) -> str:
+        """
+        (str) Returns the path of a catalogued level, for loading it
+        """
+        return os.path.join(self._directory, info.name)
+
+    def get_errors(self) -> dict[str, str]:
+        """
+        (dict[str, str]) Returns why each level file that could not be read
+        in the last scan was skipped
+        """
+        return dict(self._errors)
+
+    def select(
+        self,
+        predicate: Optional[Callable[[LevelInfo], bool]] = None,
+        key: Optional[Callable[[LevelInfo], object]] = None,
+        reverse: bool = False,
+    ) -> list[LevelInfo]:
+        """
+        Returns the metadata of the levels matching a predicate
+
+        Args:
+            predicate (Optional[Callable[[LevelInfo], bool]]): Returns True
+                for levels to include. Optional: Defaults to None, meaning
+                every level.
+            key (Optional[Callable[[LevelInfo], object]]): Sort key.
+                Optional: Defaults to None, meaning natural order of names.
+            reverse (bool): Whether to sort in descending order. Optional:
+                            Defaults to False.
+        """
+        levels = [info for info in self.get_levels()
+                  if predicate is None or predicate(info)]
+        if key is not None or reverse:
+            levels.sort(key=key or (lambda info: natural_key(info.name)),
+                        reverse=reverse)
+        return levels
+
+
+def main() -> None:
+    """Lists the levels in a directory: level_catalog.py <directory>"""
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <level directory>")
+        sys.exit(2)
+    catalog = LevelCatalog(sys.argv[1])
+    catalog.scan()
+    for info in catalog.get_levels():
+        print(f"{info.name}: {info.rows}x{info.columns}, {info.mechs} mechs, "
+              f"{info.enemies} enemies, {info.buildings} buildings "
+              f"({info.building_health} health)")
+    for name, error in catalog.get_errors().items():
+        print(f"{name}: skipped, {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from typing import Union
+
+# Level pack format. All integers are little-endian.
+#
+#   header   magic, version, #levels
+#   index    one fixed-width entry per level: offsets and lengths of the
+#            level's name and of its contents
+#   names    level names, UTF-8 encoded
+#   levels   the contents of each level file, unchanged
+#
+# Index entries have a fixed width, so any level is found with one lookup.
+PACK_MAGIC = b"ITBP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHI")
+PACK_ENTRY = struct.Struct("<QIQQ")
+PACK_EXTENSION = ".itbpack"
+
+# File extensions of the levels that are packed
+LEVEL_EXTENSIONS = (".txt", ".itb")
+
+# Number of packs whose name indices are kept after they are closed, so 
+# that reopening an unchanged pack to look up a name does not rebuild it
+INDEX_CACHE_SIZE = 16
+
+_index_cache = OrderedDict()  # (path, inode, mtime, size) -> name indices
+_index_lock = threading.Lock()
+
+
+def natural_key(name: str) -> list:
+    """
+    (list) Returns a sort key that orders "level2" before "level10"
+    """
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r"(\d+)", name)]
+
+
+def pack_levels(directory: str, pack_path: str) -> int:
+    """
+    Writes every level file in a directory into a level pack. Levels are
+    named after their files without the extension, and stored in natural
+    order of their names.
+
+    Args:
+        directory (str): Directory containing level files
+        pack_path (str): file to write the pack to
+
+    Returns:
+        int: The number of levels packed
+
+    Raises:
+        IOError: If a level cannot be read or the pack cannot be written
+    """
+    files = sorted(
+        (name for name in os.listdir(directory)
+         if name.endswith(LEVEL_EXTENSIONS)),
+        key=natural_key
+    )
+    names = [os.path.splitext(name)[0].encode() for name in files]
+    sizes = [os.path.getsize(os.path.join(directory, name)) for name in files]
+
+    # Everything after the header and index is laid out in advance
+    offset = PACK_HEADER.size + PACK_ENTRY.size * len(files)
+    entries = []
+    name_offset = offset
+    level_offset = offset + sum(len(name) for name in names)
+    for name, size in zip(names, sizes):
+        entries.append((name_offset, len(name), level_offset, size))
+        name_offset += len(name)
+        level_offset += size
+
+    with open(pack_path, "wb") as pack:
+        pack.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(files)))
+        for entry in entries:
+            pack.write(PACK_ENTRY.pack(*entry))
+        for name in names:
+            pack.write(name)
+        for file_name, size in zip(files, sizes):
+            with open(os.path.join(directory, file_name), "rb") as level:
+                data = level.read()
+            if len(data) != size:
+                raise IOError(f"{file_name} changed while being packed")
+            pack.write(data)
+    return len(files)
+
+
+class LevelPack:
+    """
+    Read-only access to a level pack. The pack is memory-mapped, so opening
+    it reads only the header, and reading a level reads only its index entry
+    and contents. The index of level names is built on the first lookup by 
+    name and shared by later LevelPacks of the same unchanged file.
+    """
+    def __init__(self, pack_path: str) -> None:
+        """
+        Opens a level pack
+
+        Args:
+            pack_path (str): file containing the pack
+
+        Raises:
+            IOError: If the file cannot be read or is not a level pack
+        """
+        self._pack_path = pack_path
+        with open(pack_path, "rb") as f:
+            status = os.fstat(f.fileno())
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise IOError(f"{pack_path} is empty") from None
+
+        if len(self._map) < PACK_HEADER.size:
+            self.close()
+            raise IOError(f"{pack_path} is too short to be a level pack")
+        magic, version, self._count = PACK_HEADER.unpack_from(self._map)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise IOError(f"{pack_path} is not a supported level pack")
+        if len(self._map) < PACK_HEADER.size + PACK_ENTRY.size * self._count:
+            self.close()
+            raise IOError(f"{pack_path} is truncated")
+
+        self._cache_key = (os.path.abspath(pack_path), status.st_ino, 
+                           status.st_mtime_ns, status.st_size)
+        with _index_lock:
+            # name -> index, built when first needed
+            self._indices = _index_cache.get(self._cache_key)
+            if self._indices is not None:
+                _index_cache.move_to_end(self._cache_key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "LevelPack":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases the memory map. Data already read stays valid.
+        """
+        self._map.close()
+
+    def _get_entry(self, index: int) -> tuple[int, int, int, int]:
+        """
+        (tuple[int, int, int, int]) Returns the name offset, name length,
+        level offset and level length of a level
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self._pack_path} has no level {index}")
+        entry = PACK_ENTRY.unpack_from(
+            self._map, PACK_HEADER.size + PACK_ENTRY.size * index
+        )
+        name_offset, name_length, level_offset, level_length = entry
+        if max(name_offset + name_length,
+               level_offset + level_length) > len(self._map):
+            raise IOError(f"{self._pack_path} is truncated")
+        return entry
+
+    def get_name(self, index: int) -> str:
+        """
+        Returns the name of a level
+
+        Args:
+            index (int): Position of the level in the pack
+
+        Raises:
+            IndexError: If there is no level at the index
+        """
+        name_offset, name_length, _, _ = self._get_entry(index)
+        return self._map[name_offset:name_offset + name_length].decode()
+
+    def get_names(self) -> list[str]:
+        """
+        (list[str]) Returns the names of all levels, in pack order
+        """
+        return [self.get_name(index) for index in range(self._count)]
+
+    def index_of(self, name: str) -> int:
+        """
+        Returns the position of the level with a given name
+
+        Args:
+            name (str): Name of the level
+
+        Raises:
+            KeyError: If no level has the name
+        """
+        if self._indices is None:
+            self._indices = {
+                name: index for index, name in enumerate(self.get_names())
+            }
+            with _index_lock:
+                _index_cache[self._cache_key] = self._indices
+                while len(_index_cache) > INDEX_CACHE_SIZE:
+                    _index_cache.popitem(last=False)
+        return self._indices[name]
+
+    def read(self, level: Union[int, str]) -> bytes:
+        """
+        Returns the contents of a level file
+
+        Args:
+            level (Union[int, str]): Position or name of the level
+
+        Returns:
+            bytes: The level, in the format it was packed in
+
+        Raises:
+            IndexError: If there is no level at the position
+            KeyError: If no level has the name
+        """
+        if isinstance(level, str):
+            level = self.index_of(level)
+        _, _, level_offset, level_length = self._get_entry(level)
+        return self._map[level_offset:level_offset + level_length]
+
+
+def main() -> None:
+    """Packs a directory of levels: level_pack.py <directory> <pack>"""
+    if len(sys.argv) != 3:
+        print(f"Usage: {sys.argv[0]} <level directory> <pack file>")
+        sys.exit(2)
+    count = pack_levels(sys.argv[1], sys.argv[2])
+    print(f"Packed {count} levels into {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
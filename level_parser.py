@@ -0,0 +1,147 @@
+import re
+from typing import Iterable, Iterator, Optional
+
+from a2_support import *
+
+# Symbols that may appear in level files
+BUILDING_SYMBOLS = "".join(str(health)
+                           for health in range(MAX_BUILDING_HEALTH + 1))
+ENTITY_SYMBOLS = (TANK_SYMBOL, HEAL_SYMBOL, SCORPION_SYMBOL, FIREFLY_SYMBOL)
+ENTITY_FIELDS = ("symbol", "row", "column", "health", "speed", "strength")
+
+# Matches the first character of a board row that is not a tile symbol
+_INVALID_TILE = re.compile(
+    "[^" + re.escape(GROUND_SYMBOL + MOUNTAIN_SYMBOL + BUILDING_SYMBOLS) + "]"
+)
+
+
+class LevelParseError(IOError):
+    """
+    Raised when a level file is malformed. Lines and columns count from 1.
+    """
+    def __init__(self, message: str, line: int, column: int) -> None:
+        super().__init__(f"line {line}, column {column}: {message}")
+        self.line = line
+        self.column = column
+
+
+class LevelParser:
+    """
+    Streams a level in the text format, one line at a time. Board rows are
+    read first, up to the blank line that separates them from the entities,
+    and then entity lines such as "T,1,1,5,3,3".
+
+    Lines are only read as rows and entities are requested, so a board can be
+    built while the file is read, without holding the whole text in memory.
+    """
+    def __init__(self, lines: Iterable[str]) -> None:
+        """
+        Creates a parser reading the given lines
+
+        Args:
+            lines (Iterable[str]): Lines of the level, such as an open file
+        """
+        self._lines = enumerate(lines, 1)
+        self._line = 0
+        self._dimensions = None
+
+    def get_dimensions(self) -> Optional[tuple[int, int]]:
+        """
+        (Optional[tuple[int, int]]) Returns the (#rows, #columns) of the board
+        once all rows have been read, or None before then
+        """
+        return self._dimensions
+
+    def rows(self) -> Iterator[str]:
+        """
+        Yields each board row as a string of tile symbols
+
+        Raises:
+            LevelParseError: If a row contains an unknown symbol or differs in
+                             width from the first row, or the board is empty
+        """
+        width = None
+        height = 0
+        for self._line, line in self._lines:
+            row = line.rstrip()
+            if not row:
+                break
+
+            invalid = _INVALID_TILE.search(row)
+            if invalid:
+                raise LevelParseError(
+                    f"unknown tile symbol {invalid.group()!r}",
+                    self._line, invalid.start() + 1
+                )
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise LevelParseError(
+                    f"row has {len(row)} tiles but the first row has {width}",
+                    self._line, min(len(row), width) + 1
+                )
+
+            height += 1
+            yield row
+
+        if width is None:
+            raise LevelParseError("level has no board", 
+                                  max(self._line, 1), 1)
+        self._dimensions = (height, width)
+
+    def entities(self) -> Iterator[tuple[str, int, int, int, int, int]]:
+        """
+        Yields the (symbol, row, column, health, speed, strength) of each
+        entity. Must only be called once every row has been read. Blank lines
+        are skipped.
+
+        Raises:
+            LevelParseError: If an entity line is malformed, or places an
+                             entity outside the board
+        """
+        if self._dimensions is None:
+            raise ValueError("board rows must be read before entities")
+        height, width = self._dimensions
+
+        for self._line, line in self._lines:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+
+            fields = line.split(",")
+            if len(fields) != len(ENTITY_FIELDS):
+                raise LevelParseError(
+                    f"expected {len(ENTITY_FIELDS)} comma separated fields, "
+                    f"found {len(fields)}", self._line, 1
+                )
+
+            # Column at which each field starts
+            columns = [1]
+            for field in fields[:-1]:
+                columns.append(columns[-1] + len(field) + 1)
+
+            symbol = fields[0].strip()
+            if symbol not in ENTITY_SYMBOLS:
+                raise LevelParseError(f"unknown entity symbol {symbol!r}",
+                                      self._line, columns[0])
+
+            values = []
+            for name, field, column in zip(ENTITY_FIELDS[1:], fields[1:],
+                                           columns[1:]):
+                try:
+                    values.append(int(field))
+                except ValueError:
+                    raise LevelParseError(
+                        f"{name} must be an integer, not {field!r}",
+                        self._line, column
+                    ) from None
+
+            row, col = values[0], values[1]
+            if not 0 <= row < height:
+                raise LevelParseError(f"row {row} is outside the board",
+                                      self._line, columns[1])
+            if not 0 <= col < width:
+                raise LevelParseError(f"column {col} is outside the board",
+                                      self._line, columns[2])
+
+            yield (symbol, *values)
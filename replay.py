@@ -0,0 +1,294 @@
+import struct
+import sys
+
+from a2_solution import (
+    BreachModel, Entity, entity_records, level_from_save, level_to_bytes
+)
+from save_format import ENTITY_RECORD, decode_entity_records, decode_save
+
+# Replay log format. All integers are little-endian.
+#
+#   header     magic, version, keyframe interval
+#   initial    length of the initial game state, then the state in the
+#              binary save format
+#   records    one per player action or keyframe, each starting with a tag:
+#
+#     MOVE_TAG      index of the entity in the model's entity list, and the
+#                   row and column it was moved to
+#     END_TURN_TAG  nothing else
+#     KEYFRAME_TAG  #buildings and #entities, then the health of each
+#                   building and one entity record per entity, as in the
+#                   binary save format, then the objective of each entity.
+#                   Written after every keyframe-interval turns, holding the
+#                   state that starts the next turn. Tiles never change, so
+#                   only the initial state stores them.
+#
+# Games are deterministic, so replaying the actions recorded after a
+# keyframe reproduces every later state. Keyframes store objectives, which
+# saves do not hold, for the reason given in Enemy.set_objective. Mechs 
+# have no objective, and store their position.
+REPLAY_MAGIC = b"ITBR"
+REPLAY_VERSION = 2
+REPLAY_HEADER = struct.Struct("<4sHI")
+LENGTH = struct.Struct("<I")
+MOVE = struct.Struct("<III")
+KEYFRAME = struct.Struct("<II")
+OBJECTIVE = struct.Struct("<II")
+
+MOVE_TAG = b"M"
+END_TURN_TAG = b"E"
+KEYFRAME_TAG = b"K"
+
+# Turns between keyframes
+KEYFRAME_INTERVAL = 10
+
+
+class ReplayRecorder:
+    """
+    Plays a game while recording it to a replay log. Moves and turns made
+    through the recorder are applied to its model and appended to the log.
+    Moves that leave the game unchanged are not recorded.
+    """
+    def __init__(
+        self,
+        model: BreachModel,
+        file_path: str,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> None:
+        """
+        Starts a replay log of a game
+
+        Args:
+            model (BreachModel): Game to play, at the start of a turn
+            file_path (str): file to write the log to
+            keyframe_interval (int): Turns between keyframes. Optional:
+                                     Defaults to KEYFRAME_INTERVAL.
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self._model = model
+        self._keyframe_interval = keyframe_interval
+        self._turn = 0
+
+        initial = level_to_bytes(model)
+        self._file = open(file_path, "wb")
+        self._file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION,
+                                            keyframe_interval))
+        self._file.write(LENGTH.pack(len(initial)))
+        self._file.write(initial)
+
+    def __enter__(self) -> "ReplayRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Finishes writing the log
+        """
+        self._file.close()
+
+    def get_model(self) -> BreachModel:
+        """
+        (BreachModel) Returns the game being recorded
+        """
+        return self._model
+
+    def attempt_move(self, entity: Entity, position: tuple[int, int]) -> None:
+        """
+        Moves an entity as BreachModel.attempt_move does, and records the move
+        if it was made
+
+        Args:
+            entity (Entity): Entity to move
+            position (tuple[int, int]): Position to move the entity to
+        """
+        start = entity.get_position()
+        self._model.attempt_move(entity, position)
+        if entity.get_position() != start:
+            row, col = position
+            index = self._model.get_entities().index(entity)
+            self._file.write(MOVE_TAG + MOVE.pack(index, row, col))
+
+    def end_turn(self) -> None:
+        """
+        Ends the turn as BreachModel.end_turn does, and records it
+        """
+        self._model.end_turn()
+        self._turn += 1
+        self._file.write(END_TURN_TAG)
+
+        if self._turn % self._keyframe_interval == 0:
+            health = self._model.get_board().get_building_health()
+            records = entity_records(self._model.get_entities())
+            self._file.write(KEYFRAME_TAG +
+                             KEYFRAME.pack(len(health), len(records)))
+            self._file.write(health)
+            for symbol, *values in records:
+                self._file.write(ENTITY_RECORD.pack(symbol.encode(), *values))
+            for entity in self._model.get_entities():
+                objective = entity.get_position() if entity.is_friendly() \
+                    else entity.get_objective()
+                self._file.write(OBJECTIVE.pack(*objective))
+
+
+class Replay:
+    """
+    A recorded game that can be viewed at the start of any turn. Seeking
+    starts from the nearest earlier keyframe and only replays the actions
+    recorded after it, so it never replays more than one keyframe interval
+    of turns.
+    """
+    def __init__(self, file_path: str) -> None:
+        """
+        Reads a replay log and indexes its turns
+
+        Args:
+            file_path (str): file containing the log
+
+        Raises:
+            IOError: If the file cannot be read or is not a valid replay log
+        """
+        with open(file_path, "rb") as f:
+            self._index(f.read(), file_path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, source: str = "replay") -> "Replay":
+        """
+        Indexes a replay log that is already in memory
+
+        Args:
+            data (bytes): The replay log
+            source (str): Name of where the log came from, for error 
+                          messages. Optional: Defaults to "replay".
+
+        Raises:
+            IOError: If the data is not a valid replay log
+        """
+        replay = cls.__new__(cls)
+        replay._index(data, source)
+        return replay
+
+    def _index(self, data: bytes, file_path: str) -> None:
+        """
+        Stores a replay log and finds its keyframes and the start of each
+        turn
+        """
+        self._file_path = file_path
+        self._data = data
+
+        if len(data) < REPLAY_HEADER.size + LENGTH.size:
+            raise IOError(f"{file_path} is too short to be a replay")
+        magic, version, _ = REPLAY_HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise IOError(f"{file_path} is not a supported replay")
+        length, = LENGTH.unpack_from(data, REPLAY_HEADER.size)
+        offset = REPLAY_HEADER.size + LENGTH.size
+        self._dimensions, self._tile_kinds, health, entities = decode_save(
+            data[offset:offset + length], file_path
+        )
+        offset += length
+
+        # Game state at each keyframe's turn, and offset of each turn's
+        # first action
+        self._keyframes = {0: (health, entities, None)}
+        self._turn_offsets = [offset]
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            offset += 1
+            if tag == MOVE_TAG:
+                offset += MOVE.size
+            elif tag == END_TURN_TAG:
+                self._turn_offsets.append(offset)
+            elif tag == KEYFRAME_TAG:
+                if offset + KEYFRAME.size > len(data):
+                    raise IOError(f"{file_path} is truncated")
+                buildings, count = KEYFRAME.unpack_from(data, offset)
+                offset += KEYFRAME.size
+                if offset + buildings + count * (ENTITY_RECORD.size 
+                                                 + OBJECTIVE.size) > len(data):
+                    raise IOError(f"{file_path} is truncated")
+                health = data[offset:offset + buildings]
+                offset += buildings
+                records = data[offset:offset + count * ENTITY_RECORD.size]
+                offset += count * ENTITY_RECORD.size
+                objectives = list(OBJECTIVE.iter_unpack(
+                    data[offset:offset + count * OBJECTIVE.size]
+                ))
+                offset += count * OBJECTIVE.size
+                self._keyframes[len(self._turn_offsets) - 1] = (
+                    health, decode_entity_records(records, file_path), 
+                    objectives
+                )
+                self._turn_offsets[-1] = offset
+            else:
+                raise IOError(f"{file_path} has an unknown record at byte "
+                              f"{offset - 1}")
+            if offset > len(data):
+                raise IOError(f"{file_path} is truncated")
+
+    def get_turn_count(self) -> int:
+        """
+        (int) Returns the number of turns that were ended in the recording
+        """
+        return len(self._turn_offsets) - 1
+
+    def seek(self, turn: int) -> BreachModel:
+        """
+        Returns the game state at the start of a turn
+
+        Args:
+            turn (int): Number of turns ended before the state, from 0 to
+                        get_turn_count()
+
+        Returns:
+            BreachModel: A new model of the game at that turn
+        """
+        if not 0 <= turn <= self.get_turn_count():
+            raise IndexError(f"{self._file_path} has no turn {turn}")
+
+        keyframe = max(start for start in self._keyframes if start <= turn)
+        health, entities, objectives = self._keyframes[keyframe]
+        model = level_from_save(
+            (self._dimensions, self._tile_kinds, health, entities),
+            self._file_path
+        )
+        if objectives is not None:
+            for entity, objective in zip(model.get_entities(), objectives):
+                if not entity.is_friendly():
+                    entity.set_objective(objective)
+
+        data = self._data
+        offset = self._turn_offsets[keyframe]
+        while keyframe < turn:
+            tag = data[offset:offset + 1]
+            offset += 1
+            if tag == MOVE_TAG:
+                index, row, col = MOVE.unpack_from(data, offset)
+                offset += MOVE.size
+                model.attempt_move(model.get_entities()[index], (row, col))
+            else:
+                # Keyframes only follow the ends of turns
+                model.end_turn()
+                keyframe += 1
+                offset = self._turn_offsets[keyframe]
+        return model
+
+
+def main() -> None:
+    """Prints a recorded game at a turn: replay.py <replay> [turn]"""
+    if len(sys.argv) not in (2, 3):
+        print(f"Usage: {sys.argv[0]} <replay file> [turn]")
+        sys.exit(2)
+    replay = Replay(sys.argv[1])
+    turn = int(sys.argv[2]) if len(sys.argv) == 3 else replay.get_turn_count()
+    print(f"Turn {turn} of {replay.get_turn_count()}")
+    print(replay.seek(turn))
+
+
+if __name__ == "__main__":
+    main()
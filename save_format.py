@@ -0,0 +1,163 @@
+import struct
+
+# Binary game state format. All integers are little-endian.
+#
+#   header     magic, version, #rows, #columns, #entities
+#   tiles      one tile kind byte per cell, in row-major order
+#   buildings  one health byte per building tile, in row-major order
+#   entities   one fixed-width record per entity, in priority order
+#
+# Entity records hold the same values as a line of the text format: the
+# entity's symbol, row, column, health, speed and strength.
+MAGIC = b"ITB\x00"
+VERSION = 1
+HEADER = struct.Struct("<4sHIII")
+ENTITY_RECORD = struct.Struct("<cIIhhh")
+
+GROUND_KIND = 0
+MOUNTAIN_KIND = 1
+BUILDING_KIND = 2
+
+
+def is_binary_save(file_path: str) -> bool:
+    """
+    Returns True if a file starts with the binary format's magic bytes
+
+    Args:
+        file_path (str): file to check
+
+    Raises:
+        IOError: If the file cannot be read
+    """
+    with open(file_path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def encode_save(
+    dimensions: tuple[int, int],
+    tile_kinds: bytes,
+    building_health: bytes,
+    entities: list[tuple[str, int, int, int, int, int]],
+) -> bytes:
+    """
+    Encodes a game state in the binary format
+
+    Args:
+        dimensions (tuple[int, int]): (#rows, #columns) of the board
+        tile_kinds (bytes): one *_KIND byte per cell, in row-major order
+        building_health (bytes): health of each building, in row-major order
+        entities (list[tuple[str, int, int, int, int, int]]): (symbol, row,
+            column, health, speed, strength) of each entity
+
+    Returns:
+        bytes: The saved game state
+    """
+    rows, cols = dimensions
+    records = bytearray(ENTITY_RECORD.size * len(entities))
+    for index, (symbol, *values) in enumerate(entities):
+        ENTITY_RECORD.pack_into(records, index * ENTITY_RECORD.size,
+                                symbol.encode(), *values)
+
+    return b"".join((
+        HEADER.pack(MAGIC, VERSION, rows, cols, len(entities)),
+        tile_kinds,
+        building_health,
+        records,
+    ))
+
+
+def read_save(file_path: str) -> tuple[
+    tuple[int, int], bytes, bytes, list[tuple[str, int, int, int, int, int]]
+]:
+    """
+    Reads a game state written by encode_save
+
+    Args:
+        file_path (str): file to read
+
+    Returns:
+        tuple: The (#rows, #columns) of the board, the tile kind of each cell,
+               the health of each building and the (symbol, row, column,
+               health, speed, strength) of each entity
+
+    Raises:
+        IOError: If the file cannot be read or is not a valid binary save
+    """
+    with open(file_path, "rb") as f:
+        return decode_save(f.read(), file_path)
+
+
+def decode_save(data: bytes, source: str = "data") -> tuple[
+    tuple[int, int], bytes, bytes, list[tuple[str, int, int, int, int, int]]
+]:
+    """
+    Decodes a game state in the binary format that is already in memory
+
+    Args:
+        data (bytes): The saved game state
+        source (str): Name of where the data came from, for error messages.
+                      Optional: Defaults to "data".
+
+    Returns:
+        tuple: The same as read_save
+
+    Raises:
+        IOError: If the data is not a valid binary save
+    """
+    if len(data) < HEADER.size:
+        raise IOError(f"{source} is too short to be a saved game")
+    magic, version, rows, cols, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise IOError(f"{source} is not a binary saved game")
+    if version != VERSION:
+        raise IOError(f"{source} uses unsupported version {version}")
+
+    if rows == 0 or cols == 0:
+        raise IOError(f"{source} has an empty board")
+
+    offset = HEADER.size
+    tile_kinds = data[offset:offset + rows * cols]
+    offset += rows * cols
+    buildings = tile_kinds.count(BUILDING_KIND)
+    building_health = data[offset:offset + buildings]
+    offset += buildings
+    records = data[offset:offset + count * ENTITY_RECORD.size]
+    if len(tile_kinds) != rows * cols or len(building_health) != buildings \
+            or len(records) != count * ENTITY_RECORD.size:
+        raise IOError(f"{source} is truncated")
+
+    if tile_kinds.translate(
+            None, bytes([GROUND_KIND, MOUNTAIN_KIND, BUILDING_KIND])):
+        raise IOError(f"{source} contains unknown tile kinds")
+
+    return (rows, cols), tile_kinds, building_health, \
+        decode_entity_records(records, source)
+
+
+def decode_entity_records(
+    records: bytes, 
+    source: str = "data",
+) -> list[tuple[str, int, int, int, int, int]]:
+    """
+    Unpacks consecutive entity records
+
+    Args:
+        records (bytes): The records. Precondition: the length is a multiple
+                         of ENTITY_RECORD.size
+        source (str): Name of where the records came from, for error 
+                      messages. Optional: Defaults to "data".
+
+    Returns:
+        list[tuple[str, int, int, int, int, int]]: The (symbol, row, column,
+            health, speed, strength) of each entity
+
+    Raises:
+        IOError: If an entity symbol is not an ASCII character
+    """
+    try:
+        return [
+            (symbol.decode("ascii"), *values)
+            for symbol, *values in ENTITY_RECORD.iter_unpack(records)
+        ]
+    except UnicodeDecodeError:
+        raise IOError(f"{source} contains an invalid entity symbol") from None
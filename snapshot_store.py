@@ -0,0 +1,189 @@
+import hashlib
+import os
+import struct
+import zlib
+from collections import OrderedDict
+
+from a2_solution import BreachModel, entity_records, level_from_save
+from autosave import write_atomically
+from save_format import ENTITY_RECORD, decode_entity_records
+
+# A snapshot is split into blocks, each stored once under the SHA-256 hash
+# of its contents, compressed with zlib:
+#
+#   terrain    #rows and #columns, then the tile kind of each cell
+#   buildings  the health of each building, in row-major order
+#   entities   one entity record per entity, as in the binary save format,
+#              then the objective of each entity. Mechs have no objective,
+#              and store their position.
+#   manifest   magic, version, and the hashes of the three blocks above
+#
+# A snapshot is named by the hash of its manifest. States of the same game
+# share their terrain block, and states that differ only in their entities
+# also share their buildings block, so each extra state costs little more
+# than its entities.
+MANIFEST_MAGIC = b"ITBS"
+MANIFEST_VERSION = 2
+MANIFEST = struct.Struct("<4sH32s32s32s")
+DIMENSIONS = struct.Struct("<II")
+OBJECTIVE = struct.Struct("<II")
+
+# Number of decoded blocks kept in memory for reassembling snapshots
+BLOCK_CACHE_SIZE = 64
+
+
+class SnapshotStore:
+    """
+    A content-addressed store of game states in a directory. Blocks are
+    written to files named by their hash, in subdirectories named by the
+    hash's first two digits, and identical blocks are only written once.
+    """
+    def __init__(self, directory: str) -> None:
+        """
+        Opens a store, creating the directory if it does not exist
+
+        Args:
+            directory (str): Directory containing the blocks
+        """
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._blocks = OrderedDict()  # hash -> contents, least recent first
+
+    def _block_path(self, digest: bytes) -> str:
+        """
+        (str) Returns the file that stores a block
+        """
+        name = digest.hex()
+        return os.path.join(self._directory, name[:2], name[2:])
+
+    def _put_block(self, data: bytes) -> bytes:
+        """
+        Stores a block unless an identical one is already stored
+
+        Returns:
+            bytes: The block's hash
+        """
+        digest = hashlib.sha256(data).digest()
+        if digest not in self._blocks:
+            path = self._block_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                write_atomically(path, zlib.compress(data, 1))
+        self._cache_block(digest, data)
+        return digest
+
+    def _get_block(self, digest: bytes) -> bytes:
+        """
+        Returns the contents of a block
+
+        Raises:
+            KeyError: If no block has the hash
+            IOError: If the block is corrupt
+        """
+        data = self._blocks.get(digest)
+        if data is None:
+            try:
+                with open(self._block_path(digest), "rb") as f:
+                    data = zlib.decompress(f.read())
+            except FileNotFoundError:
+                raise KeyError(f"no block {digest.hex()}") from None
+            except zlib.error as e:
+                raise IOError(f"block {digest.hex()} is corrupt: {e}") \
+                    from None
+            if hashlib.sha256(data).digest() != digest:
+                raise IOError(f"block {digest.hex()} is corrupt")
+        self._cache_block(digest, data)
+        return data
+
+    def _cache_block(self, digest: bytes, data: bytes) -> None:
+        """
+        Keeps a block in memory, evicting the least recently used if full
+        """
+        self._blocks[digest] = data
+        self._blocks.move_to_end(digest)
+        while len(self._blocks) > BLOCK_CACHE_SIZE:
+            self._blocks.popitem(last=False)
+
+    def put(self, model: BreachModel) -> str:
+        """
+        Stores a game state
+
+        Args:
+            model (BreachModel): Game state at the start of a turn
+
+        Returns:
+            str: The snapshot's id, which is the same for equal game states
+        """
+        board = model.get_board()
+        records = entity_records(model.get_entities())
+        entities = bytearray(ENTITY_RECORD.size * len(records))
+        for index, (symbol, *values) in enumerate(records):
+            ENTITY_RECORD.pack_into(entities, index * ENTITY_RECORD.size,
+                                    symbol.encode(), *values)
+        # Objectives are stored as explained in Enemy.set_objective
+        for entity in model.get_entities():
+            entities += OBJECTIVE.pack(
+                *(entity.get_position() if entity.is_friendly() 
+                  else entity.get_objective())
+            )
+
+        manifest = MANIFEST.pack(
+            MANIFEST_MAGIC, MANIFEST_VERSION,
+            self._put_block(DIMENSIONS.pack(*board.get_dimensions())
+                            + board.get_tile_kinds()),
+            self._put_block(board.get_building_health()),
+            self._put_block(bytes(entities)),
+        )
+        return self._put_block(manifest).hex()
+
+    def get(self, snapshot_id: str) -> BreachModel:
+        """
+        Reassembles a stored game state
+
+        Args:
+            snapshot_id (str): The id returned by put
+
+        Returns:
+            BreachModel: A new model of the game state
+
+        Raises:
+            KeyError: If no snapshot has the id
+            IOError: If the snapshot is corrupt
+        """
+        try:
+            manifest = self._get_block(bytes.fromhex(snapshot_id))
+        except (ValueError, KeyError):
+            raise KeyError(f"no snapshot {snapshot_id}") from None
+        if len(manifest) != MANIFEST.size:
+            raise KeyError(f"{snapshot_id} is not a snapshot")
+        magic, version, terrain, health, entities = MANIFEST.unpack(manifest)
+        if magic != MANIFEST_MAGIC or version != MANIFEST_VERSION:
+            raise KeyError(f"{snapshot_id} is not a snapshot")
+
+        terrain = self._get_block(terrain)
+        dimensions = DIMENSIONS.unpack_from(terrain)
+        entities = self._get_block(entities)
+        count, remainder = divmod(len(entities),
+                                  ENTITY_RECORD.size + OBJECTIVE.size)
+        if remainder:
+            raise IOError(f"snapshot {snapshot_id} has corrupt entities")
+        split = count * ENTITY_RECORD.size
+        model = level_from_save((
+            dimensions,
+            terrain[DIMENSIONS.size:],
+            self._get_block(health),
+            decode_entity_records(entities[:split], f"snapshot {snapshot_id}"),
+        ), f"snapshot {snapshot_id}")
+
+        for entity, objective in zip(model.get_entities(),
+                                     OBJECTIVE.iter_unpack(entities[split:])):
+            if not entity.is_friendly():
+                entity.set_objective(objective)
+        return model
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        try:
+            digest = bytes.fromhex(snapshot_id)
+        except ValueError:
+            return False
+        return os.path.exists(self._block_path(digest))
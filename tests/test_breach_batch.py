@@ -0,0 +1,106 @@
+import random
+import unittest
+
+import numpy as np
+
+from a2_support import *
+from a2_solution import level_from_lines
+from breach_batch import BatchBreachModel
+
+LEVELS = 40
+GAMES = 4
+TURNS = 15
+SEED = 2026
+
+
+def random_level(rng: random.Random) -> list[str]:
+    """
+    (list[str]) Returns the lines of a random level in the text format,
+    surrounded by mountains as BatchBreachModel requires
+    """
+    height, width = rng.randint(5, 12), rng.randint(5, 12)
+    interior = " " * 12 + MOUNTAIN_SYMBOL + "0123456789"
+    rows = [MOUNTAIN_SYMBOL * width]
+    for _ in range(height - 2):
+        rows.append(MOUNTAIN_SYMBOL
+                    + "".join(rng.choice(interior) for _ in range(width - 2))
+                    + MOUNTAIN_SYMBOL)
+    rows.append(MOUNTAIN_SYMBOL * width)
+
+    free = [(row, col) for row in range(height) for col in range(width)
+            if rows[row][col] == GROUND_SYMBOL]
+    rng.shuffle(free)
+    entities = []
+    for row, col in free[:rng.randint(2, 10)]:
+        symbol = rng.choice((TANK_SYMBOL, HEAL_SYMBOL,
+                             SCORPION_SYMBOL, FIREFLY_SYMBOL))
+        entities.append((symbol, row, col, rng.randint(1, 9),
+                         rng.randint(1, 5), rng.randint(1, 4)))
+    # Mechs come before enemies in priority order
+    entities.sort(key=lambda entity: entity[0] not in (TANK_SYMBOL,
+                                                        HEAL_SYMBOL))
+    return rows + [""] + [",".join(map(str, entity)) for entity in entities]
+
+
+class BatchBreachModelTest(unittest.TestCase):
+    """
+    Plays random levels with BreachModel and BatchBreachModel side by side,
+    making the same random moves in both, and compares them every turn
+    """
+    def test_matches_breach_model(self) -> None:
+        rng = random.Random(SEED)
+        for level in range(LEVELS):
+            lines = random_level(rng)
+            with self.subTest(level=level, lines=lines):
+                self._play(lines, rng)
+
+    def _play(self, lines: list[str], rng: random.Random) -> None:
+        models = [level_from_lines(lines) for _ in range(GAMES)]
+        batch = BatchBreachModel(models[0].copy(), GAMES)
+
+        # Entities of each model by slot, which is their initial index
+        slots = [list(model.get_entities()) for model in models]
+        friendly = [entity.is_friendly() for entity in slots[0]]
+
+        for turn in range(TURNS):
+            for slot in range(len(friendly)):
+                if not friendly[slot]:
+                    continue
+                mask = batch.valid_movement_mask(slot)
+                targets = np.full((GAMES, 2), -1)
+                for game, model in enumerate(models):
+                    entity = slots[game][slot]
+                    if entity not in model.get_entities():
+                        continue
+                    positions = model.get_valid_movement_positions(entity)
+                    self.assertEqual(
+                        sorted(map(tuple, np.argwhere(mask[game]))),
+                        sorted(positions), (turn, game, slot)
+                    )
+                    if positions and rng.random() < 0.8:
+                        position = rng.choice(positions)
+                        model.attempt_move(entity, position)
+                        targets[game] = position
+                batch.attempt_moves(slot, targets)
+
+            for model in models:
+                model.end_turn()
+            batch.end_turn()
+
+            won, lost = batch.has_won(), batch.has_lost()
+            for game, model in enumerate(models):
+                state = batch.get_model(game)
+                self.assertEqual(str(state), str(model), (turn, game))
+                self.assertEqual(
+                    [entity.get_objective() for entity in state.get_entities()
+                     if not entity.is_friendly()],
+                    [entity.get_objective() for entity in model.get_entities()
+                     if not entity.is_friendly()],
+                    (turn, game)
+                )
+                self.assertEqual(won[game], model.has_won(), (turn, game))
+                self.assertEqual(lost[game], model.has_lost(), (turn, game))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from breach_env import BreachEnv, END_TURN_ACTION
+from test_breach_batch import random_level
+
+LEVELS = 40
+TURNS = 20
+SEED = 2029
+
+
+class BreachEnvTest(unittest.TestCase):
+    """
+    Plays random levels until a mech dies, then checks that moving the dead
+    mech leaves the game unchanged
+    """
+    def test_dead_mech_cannot_move(self) -> None:
+        rng = random.Random(SEED)
+        deaths = 0
+        with tempfile.TemporaryDirectory() as directory:
+            for level in range(LEVELS):
+                path = os.path.join(directory, f"level{level}.txt")
+                with open(path, "w") as f:
+                    f.write("\n".join(random_level(rng)))
+                with self.subTest(level=level):
+                    deaths += self._play(BreachEnv(path))
+        self.assertGreater(deaths, 0, "no mech died, so nothing was tested")
+
+    def _play(self, env: BreachEnv) -> bool:
+        """
+        (bool) Returns whether a mech died, after checking moves of it
+        """
+        env.reset()
+        mechs = [entity for entity in env.get_model().get_entities()
+                 if entity.is_friendly()]
+        for _ in range(TURNS):
+            _, _, done, _ = env.step(END_TURN_ACTION)
+            dead = [index for index, mech in enumerate(mechs)
+                    if not mech.is_alive()]
+            if done or dead:
+                break
+        if done or not dead:
+            return False
+
+        model = env.get_model()
+        text, state_hash = str(model), model.state_hash()
+        observation = env.get_observation().copy()
+        height, width = model.get_board().get_dimensions()
+        for row in range(height):
+            for col in range(width):
+                env.step(env.move_action(dead[0], (row, col)))
+        self.assertEqual(str(model), text)
+        self.assertEqual(model.state_hash(), state_hash)
+        self.assertEqual(model.state_hash(), model._compute_hash())
+        self.assertTrue(model.ready_to_save())
+        np.testing.assert_array_equal(env.get_observation(), observation)
+        return True
+
+
+if __name__ == "__main__":
+    unittest.main()